@@ -5,6 +5,7 @@ This script helps diagnose database connectivity issues.
 """
 
 import asyncio
+import logging
 import os
 import sys
 from dotenv import load_dotenv
@@ -15,8 +16,13 @@ sys.path.insert(0, './src')
 # Load environment variables
 load_dotenv()
 
+from src.config.logging_setup import setup_logging
 from src.database.connection import db_manager
 
+# Set up logging for library modules (written to stderr by a background
+# thread); the script's own report is printed to stdout
+setup_logging(level=logging.INFO)
+
 async def check_database():
     """Check database connection and configuration."""
     print("🔍 AI Blog Generator - Database Connection Checker")
@@ -51,12 +57,9 @@ async def check_database():
         # Test basic operations
         print("🧪 Testing basic database operations...")
         
-        # Try to count blog posts
-        posts = await db_manager.get_recent_blog_posts(limit=1)
+        # Try to count blog posts and get stats
+        posts, stats = await db_manager.get_dashboard(limit=1, hours=24)
         print(f"📊 Found {len(posts)} recent blog posts")
-        
-        # Try to get stats
-        stats = await db_manager.get_generation_stats(hours=24)
         print(f"📈 Generation stats: {stats.get('total_attempts', 0)} attempts in last 24h")
         
         print("\n🎉 All database tests passed!")
@@ -73,8 +76,7 @@ async def check_database():
         return False
         
     finally:
-        if db_manager._connected:
-            await db_manager.disconnect()
+        if await db_manager.ensure_disconnected():
             print("🔌 Database connection closed")
 
 async def main():
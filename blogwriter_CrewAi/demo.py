@@ -8,9 +8,11 @@ import asyncio
 import logging
 from datetime import datetime
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+from src.config.logging_setup import setup_logging
+
+# Set up logging for library modules (written to stderr by a background
+# thread); the script's own report is printed to stdout
+setup_logging(level=logging.INFO)
 
 async def demo_blog_generation():
     """Demo the blog generation functionality."""
@@ -42,21 +44,21 @@ async def demo_blog_generation():
         print("\n📝 Generating test blog post...")
         print("This may take 2-5 minutes depending on AI response times...")
         
-        # Test both themes
-        print("Testing GenAI theme...")
-        genai_result = await blog_generator.generate_blog_post(
+        # Test both themes plus random selection concurrently
+        print("Testing GenAI, Blockchain and Random themes concurrently...")
+        genai_task = asyncio.create_task(blog_generator.generate_blog_post(
             custom_topic="Latest developments in Large Language Models and their applications in 2024",
             theme="genai"
-        )
-        
-        print("Testing Blockchain theme...")
-        blockchain_result = await blog_generator.generate_blog_post(
+        ))
+        blockchain_task = asyncio.create_task(blog_generator.generate_blog_post(
             custom_topic="DeFi protocols and decentralized finance innovations in 2024", 
             theme="blockchain"
-        )
+        ))
+        random_task = asyncio.create_task(blog_generator.generate_blog_post())  # Random theme
         
-        print("Testing Random theme selection...")
-        random_result = await blog_generator.generate_blog_post()  # Random theme
+        genai_result, blockchain_result, random_result = await asyncio.gather(
+            genai_task, blockchain_task, random_task, return_exceptions=True
+        )
         
         # Show results for all tests
         results = [
@@ -66,7 +68,9 @@ async def demo_blog_generation():
         ]
         
         for theme_name, result in results:
-            if result:
+            if isinstance(result, Exception):
+                print(f"❌ {theme_name} blog generation failed: {result}")
+            elif result:
                 print(f"\n🎉 {theme_name} blog post generated successfully!")
                 print(f"   Title: {result['title']}")
                 print(f"   Topic: {result['topic']}")
@@ -78,9 +82,11 @@ async def demo_blog_generation():
         
 
         
+        # Fetch recent posts and generation stats in one query
+        recent_posts, stats = await db_manager.get_dashboard(limit=5, hours=24)
+        
         # Show recent posts
         print("\n📚 Recent blog posts:")
-        recent_posts = await db_manager.get_recent_blog_posts(limit=5)
         
         if recent_posts:
             for i, post in enumerate(recent_posts, 1):
@@ -91,7 +97,6 @@ async def demo_blog_generation():
         
         # Show generation stats
         print("\n📊 Generation statistics:")
-        stats = await db_manager.get_generation_stats(hours=24)
         if stats:
             print(f"   Total attempts (24h): {stats.get('total_attempts', 0)}")
             print(f"   Successful: {stats.get('successful_attempts', 0)}")
@@ -103,7 +108,6 @@ async def demo_blog_generation():
         print("\n✅ Demo completed successfully!")
         
     except Exception as e:
-        logger.error(f"Demo failed: {e}")
         print(f"\n❌ Demo failed: {e}")
 
 async def demo_scheduler():
@@ -133,26 +137,27 @@ async def demo_scheduler():
     except Exception as e:
         print(f"Scheduler demo error: {e}")
 
+# API usage examples: (name, endpoint, example command)
+API_EXAMPLES = (
+    ("Health Check", "GET /health", "curl http://localhost:8000/health"),
+    ("Generate Random Theme", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{}\''),
+    ("Generate GenAI Blog", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{"theme": "genai"}\''),
+    ("Generate Blockchain Blog", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{"theme": "blockchain"}\''),
+    ("Custom Topic + Theme", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{"topic": "DeFi innovations", "theme": "blockchain"}\''),
+    ("Get Recent Posts", "GET /posts", "curl http://localhost:8000/posts?limit=5"),
+    ("Get Statistics", "GET /stats", "curl http://localhost:8000/stats?hours=24"),
+    ("Start Scheduler", "POST /scheduler/start", 'curl -X POST "http://localhost:8000/scheduler/start" -H "Content-Type: application/json" -d \'{"interval_minutes": 1440}\''),
+)
+
+# Rendered once at import so show_api_examples issues a single write
+_API_EXAMPLES_TEXT = "\n".join(
+    ["\n🌐 API Usage Examples", "-" * 30]
+    + [f"\n{name}:\n  Endpoint: {endpoint}\n  Example: {example}" for name, endpoint, example in API_EXAMPLES]
+)
+
 def show_api_examples():
     """Show API usage examples."""
-    print("\n🌐 API Usage Examples")
-    print("-" * 30)
-    
-    examples = [
-        ("Health Check", "GET /health", "curl http://localhost:8000/health"),
-        ("Generate Random Theme", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{}\''),
-        ("Generate GenAI Blog", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{"theme": "genai"}\''),
-        ("Generate Blockchain Blog", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{"theme": "blockchain"}\''),
-        ("Custom Topic + Theme", "POST /generate", 'curl -X POST "http://localhost:8000/generate" -H "Content-Type: application/json" -d \'{"topic": "DeFi innovations", "theme": "blockchain"}\''),
-        ("Get Recent Posts", "GET /posts", "curl http://localhost:8000/posts?limit=5"),
-        ("Get Statistics", "GET /stats", "curl http://localhost:8000/stats?hours=24"),
-        ("Start Scheduler", "POST /scheduler/start", 'curl -X POST "http://localhost:8000/scheduler/start" -H "Content-Type: application/json" -d \'{"interval_minutes": 1440}\''),
-    ]
-    
-    for name, endpoint, example in examples:
-        print(f"\n{name}:")
-        print(f"  Endpoint: {endpoint}")
-        print(f"  Example: {example}")
+    print(_API_EXAMPLES_TEXT)
 
 async def main():
     """Main demo function."""
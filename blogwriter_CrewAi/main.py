@@ -7,50 +7,139 @@ every 10 minutes and saves them to a PostgreSQL database using Prisma.
 
 import asyncio
 import logging
+import os
 import signal
-import sys
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.scheduler import blog_scheduler, start_blog_scheduler, stop_blog_scheduler, trigger_blog_generation
 from src.database.connection import db_manager
 from src.blog_generator import blog_generator
+from src.config.logging_setup import setup_logging
 
 # Load environment variables
 load_dotenv()
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Set up logging (written by a background thread, off the event loop)
+setup_logging(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
 # Global variables
 scheduler_started = False
+db_ready = False
+db_health_task: Optional[asyncio.Task] = None
+timestamp_task: Optional[asyncio.Task] = None
+
+# Number of uvicorn worker processes in API mode
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Each worker runs its own lifespan, so the in-process scheduler is only
+# started for a single worker; otherwise run the standalone mode alongside
+RUN_SCHEDULER = os.getenv("RUN_SCHEDULER", "true").lower() == "true" and WEB_CONCURRENCY == 1
+
+# Seconds between background database health probes
+DB_HEALTH_CHECK_INTERVAL = 30
+
+# Seconds between refreshes of the cached response timestamp
+TIMESTAMP_REFRESH_INTERVAL = 0.25
+_now_iso = ""
+
+async def refresh_timestamp(interval: float = TIMESTAMP_REFRESH_INTERVAL):
+    """Keep a pre-formatted ISO timestamp current for response bodies."""
+    global _now_iso
+    
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(interval)
+
+def current_timestamp() -> str:
+    """Return the cached ISO timestamp, or a fresh one before the ticker starts."""
+    return _now_iso or datetime.now().isoformat()
+
+# Seconds a scheduler status snapshot is reused by polled endpoints
+SCHEDULER_INFO_TTL = 1.0
+_scheduler_info_cache = {"t": 0.0, "v": None}
+
+def cached_scheduler_info() -> dict:
+    """Return scheduler running state and jobs, refreshed at most once per TTL."""
+    now = time.monotonic()
+    if _scheduler_info_cache["v"] is None or now - _scheduler_info_cache["t"] > SCHEDULER_INFO_TTL:
+        _scheduler_info_cache["v"] = {
+            "running": blog_scheduler.is_running(),
+            "jobs": blog_scheduler.get_job_info()
+        }
+        _scheduler_info_cache["t"] = now
+    return _scheduler_info_cache["v"]
+
+def invalidate_scheduler_info():
+    """Drop the cached scheduler snapshot after a start/stop."""
+    _scheduler_info_cache["v"] = None
+
+def require_single_worker():
+    """Reject scheduler control when requests are spread across worker processes."""
+    if WEB_CONCURRENCY > 1:
+        raise HTTPException(
+            status_code=409,
+            detail="Scheduler control is unavailable with WEB_CONCURRENCY > 1; run the scheduler in standalone mode"
+        )
+
+async def monitor_database_health(interval: int = DB_HEALTH_CHECK_INTERVAL):
+    """Periodically probe the database and reconnect outside the request path."""
+    global db_ready
+    
+    while True:
+        await asyncio.sleep(interval)
+        healthy = await db_manager.health_check()
+        
+        if not healthy:
+            try:
+                await db_manager.connect(retries=1)
+                healthy = await db_manager.health_check()
+            except Exception as e:
+                logger.error(f"Database reconnect failed: {e}")
+        
+        if healthy != db_ready:
+            logger.info(f"Database readiness changed: {'ready' if healthy else 'not ready'}")
+        db_ready = healthy
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown."""
-    global scheduler_started
+    global scheduler_started, db_ready, db_health_task, timestamp_task
     
     # Startup
     try:
         logger.info("Starting AI Blog Generator application...")
         
-        # Connect to database
-        await db_manager.connect()
+        timestamp_task = asyncio.create_task(refresh_timestamp())
+        
+        # Connect to database once; requests share this connection pool
+        await db_manager.startup(app)
+        db_ready = True
+        db_health_task = asyncio.create_task(monitor_database_health())
         logger.info("Database connected successfully")
         
+        # Import CrewAI and create the shared search tool off the event loop, so
+        # the first generation request doesn't pay for them (agents are built per run)
+        try:
+            await asyncio.to_thread(blog_generator.warm_up)
+            logger.info("Blog generator warmed up")
+        except Exception as e:
+            logger.warning(f"Blog generator warm-up failed, CrewAI will be loaded on first use: {e}")
+        
         # Start the scheduler
-        if not scheduler_started:
+        if not RUN_SCHEDULER:
+            logger.info("In-process scheduler disabled - run RUN_MODE=standalone to generate posts on a schedule")
+        elif not scheduler_started:
             blog_scheduler.start_scheduler(interval_minutes=1440)  # 1 day = 1440 minutes
             scheduler_started = True
             logger.info("Blog scheduler started successfully - generating posts every 24 hours")
@@ -67,6 +156,14 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Shutting down AI Blog Generator application...")
         
+        # Stop background tasks
+        if db_health_task:
+            db_health_task.cancel()
+            db_health_task = None
+        if timestamp_task:
+            timestamp_task.cancel()
+            timestamp_task = None
+        
         # Stop scheduler
         if scheduler_started:
             blog_scheduler.stop_scheduler()
@@ -74,7 +171,7 @@ async def lifespan(app: FastAPI):
             logger.info("Scheduler stopped")
         
         # Disconnect from database
-        await db_manager.disconnect()
+        await db_manager.shutdown(app)
         logger.info("Database disconnected")
         
         logger.info("Application shutdown completed")
@@ -99,12 +196,15 @@ origins = [
     "http://localhost:5173",
 ]
 
+CORS_ALLOW_METHODS = ("*",)
+CORS_ALLOW_HEADERS = ("*",)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins="*",
+    allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
 )
 
 # Pydantic models for API
@@ -114,6 +214,9 @@ class BlogGenerationRequest(BaseModel):
     
 class SchedulerConfig(BaseModel):
     interval_minutes: int = 10
+    coalesce: bool = True
+    max_instances: int = 1
+    misfire_grace_time: int = 60
 
 # API Endpoints
 
@@ -124,52 +227,46 @@ async def root():
         "message": "AI Blog Generator API",
         "description": "Automated blog generation system for generative AI topics",
         "version": "1.0.0",
-        "scheduler_running": blog_scheduler.is_running(),
+        "scheduler_running": cached_scheduler_info()["running"],
         "endpoints": {
             "health": "/health",
             "generate": "/generate",
             "posts": "/posts",
             "stats": "/stats",
+            "dashboard": "/dashboard",
             "scheduler": "/scheduler"
         }
     }
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Health check endpoint."""
     try:
-        # Check database health
-        db_healthy = await db_manager.health_check()
-        if not db_healthy:
-            # Try to reconnect
-            await db_manager.connect()
-            db_healthy = await db_manager.health_check()
+        # Readiness is maintained by the background health monitor
+        db_healthy = db_ready
         
         status = "healthy" if db_healthy else "unhealthy"
         status_code = 200 if db_healthy else 503
         
         response_data = {
             "status": status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": current_timestamp(),
             "database": "connected" if db_healthy else "disconnected",
-            "scheduler": "running" if blog_scheduler.is_running() else "stopped"
+            "scheduler": "running" if cached_scheduler_info()["running"] else "stopped"
         }
         
-        if db_healthy:
-            return response_data
-        else:
-            return JSONResponse(
-                status_code=status_code,
-                content=response_data
-            )
+        return ORJSONResponse(
+            status_code=status_code,
+            content=response_data
+        )
             
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": current_timestamp(),
                 "database": "error",
                 "scheduler": "unknown",
                 "error": str(e)
@@ -200,43 +297,61 @@ async def generate_blog_post(request: BlogGenerationRequest, background_tasks: B
         logger.error(f"Error generating blog post: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def post_summary(post: dict) -> dict:
+    """Map a summary row from the database to the /posts response shape."""
+    return {
+        "id": post["id"],
+        "title": post["title"],
+        "topic": post["topic"],
+        "tags": post["tags"],
+        "word_count": post["wordCount"],
+        "meta_description": post["metaDescription"],
+        "slug": post["slug"],
+        "created_at": post["createdAt"],
+        "updated_at": post["updatedAt"],
+        "published": post["published"]
+    }
+
 @app.get("/posts")
 async def get_recent_posts(limit: int = 10):
     """Get recent blog posts."""
+    # Listing omits full content; use /posts/{post_id} for the markdown body
+    rows = db_manager.stream_recent_blog_posts(limit=limit)
+    
     try:
-        posts = await db_manager.get_recent_blog_posts(limit=limit)
-        
-        return {
-            "posts": [
-                {
-                    "id": post.id,
-                    "title": post.title,
-                    "content": post.content,
-                    "topic": post.topic,
-                    "tags": post.tags,
-                    "word_count": post.wordCount,
-                    "meta_description": post.metaDescription,
-                    "slug": post.slug,
-                    "created_at": post.createdAt.isoformat(),
-                    "updated_at": post.updatedAt.isoformat(),
-                    "published": post.published
-                }
-                for post in posts
-            ],
-            "count": len(posts),
-            "timestamp": datetime.now().isoformat()
-        }
-        
+        # Fetch the first row up front so database errors still map to a 500
+        first = await rows.__anext__()
+    except StopAsyncIteration:
+        first = None
     except Exception as e:
         logger.error(f"Error fetching posts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    async def body():
+        count = 0
+        yield b'{"posts":['
+        
+        if first is not None:
+            yield orjson.dumps(post_summary(first))
+            count = 1
+            
+            try:
+                async for post in rows:
+                    yield b',' + orjson.dumps(post_summary(post))
+                    count += 1
+            except Exception as e:
+                # Headers are already sent; end with a valid, truncated listing
+                logger.error(f"Error streaming posts: {e}")
+        
+        yield b'],"count":' + orjson.dumps(count) + b',"timestamp":' + orjson.dumps(current_timestamp()) + b'}'
+    
+    return StreamingResponse(body(), media_type="application/json")
 
 @app.get("/posts/{post_id}")
 async def get_blog_post(post_id: int):
     """Get a specific blog post by ID."""
     try:
-        await db_manager.connect()
-        post = await db_manager.db.blogpost.find_unique(where={"id": post_id})
+        post = await db_manager.get_blog_post(post_id)
         
         if not post:
             raise HTTPException(status_code=404, detail="Blog post not found")
@@ -259,32 +374,62 @@ async def get_blog_post(post_id: int):
         logger.error(f"Error fetching blog post {post_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/stats")
+@app.get("/stats", response_class=ORJSONResponse)
 async def get_generation_stats(hours: int = 24):
     """Get blog generation statistics."""
     try:
         stats = await db_manager.get_generation_stats(hours=hours)
         
-        return {
+        return ORJSONResponse({
             "stats": stats,
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": current_timestamp()
+        })
         
     except Exception as e:
         logger.error(f"Error fetching stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/scheduler")
+@app.get("/dashboard", response_class=ORJSONResponse)
+async def get_dashboard(limit: int = 10, hours: int = 24):
+    """Get recent blog posts together with generation statistics."""
+    try:
+        posts, stats = await db_manager.get_dashboard(limit=limit, hours=hours)
+        
+        return ORJSONResponse({
+            "posts": [
+                {
+                    "id": post.id,
+                    "title": post.title,
+                    "topic": post.topic,
+                    "tags": post.tags,
+                    "word_count": post.wordCount,
+                    "slug": post.slug,
+                    "created_at": post.createdAt,
+                    "published": post.published
+                }
+                for post in posts
+            ],
+            "stats": stats,
+            "timestamp": current_timestamp()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error fetching dashboard: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/scheduler", response_class=ORJSONResponse)
 async def get_scheduler_info():
     """Get scheduler information."""
+    require_single_worker()
+    
     try:
-        jobs = blog_scheduler.get_job_info()
+        scheduler_info = cached_scheduler_info()
         
-        return {
-            "running": blog_scheduler.is_running(),
-            "jobs": jobs,
-            "timestamp": datetime.now().isoformat()
-        }
+        return ORJSONResponse({
+            "running": scheduler_info["running"],
+            "jobs": scheduler_info["jobs"],
+            "timestamp": current_timestamp()
+        })
         
     except Exception as e:
         logger.error(f"Error fetching scheduler info: {e}")
@@ -293,21 +438,29 @@ async def get_scheduler_info():
 @app.post("/scheduler/start")
 async def start_scheduler(config: SchedulerConfig):
     """Start the scheduler with specified interval."""
+    require_single_worker()
+    
     try:
         global scheduler_started
         
         if scheduler_started:
             return {
                 "message": "Scheduler is already running",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": current_timestamp()
             }
         
-        blog_scheduler.start_scheduler(interval_minutes=config.interval_minutes)
+        blog_scheduler.start_scheduler(
+            interval_minutes=config.interval_minutes,
+            coalesce=config.coalesce,
+            max_instances=config.max_instances,
+            misfire_grace_time=config.misfire_grace_time
+        )
         scheduler_started = True
+        invalidate_scheduler_info()
         
         return {
             "message": f"Scheduler started with {config.interval_minutes} minute interval",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": current_timestamp()
         }
         
     except Exception as e:
@@ -317,44 +470,30 @@ async def start_scheduler(config: SchedulerConfig):
 @app.post("/scheduler/stop")
 async def stop_scheduler_endpoint():
     """Stop the scheduler."""
+    require_single_worker()
+    
     try:
         global scheduler_started
         
         if not scheduler_started:
             return {
                 "message": "Scheduler is not running",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": current_timestamp()
             }
         
         blog_scheduler.stop_scheduler()
         scheduler_started = False
+        invalidate_scheduler_info()
         
         return {
             "message": "Scheduler stopped successfully",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": current_timestamp()
         }
         
     except Exception as e:
         logger.error(f"Error stopping scheduler: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-# Signal handlers for graceful shutdown
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    logger.info(f"Received signal {signum}, shutting down gracefully...")
-    
-    # Stop scheduler
-    global scheduler_started
-    if scheduler_started:
-        blog_scheduler.stop_scheduler()
-        scheduler_started = False
-    
-    sys.exit(0)
-
-# Register signal handlers
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
-
 # Standalone mode
 async def main():
     """Run the application in standalone mode (without FastAPI server)."""
@@ -373,14 +512,16 @@ async def main():
         logger.info("Generating initial blog post...")
         await trigger_blog_generation()
         
-        # Keep the application running
+        # Keep the application running until a stop signal arrives
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+        
         logger.info("Application is running. Press Ctrl+C to stop.")
         
         try:
-            while True:
-                await asyncio.sleep(60)  # Check every minute
-                
-        except KeyboardInterrupt:
+            await stop_event.wait()
             logger.info("Received interrupt signal, shutting down...")
             
         finally:
@@ -397,13 +538,16 @@ if __name__ == "__main__":
     import uvicorn
     
     # Check if we want to run in API mode or standalone mode
-    import os
-    
     mode = os.getenv("RUN_MODE", "api").lower()
     
     if mode == "standalone":
-        # Run in standalone mode
-        asyncio.run(main())
+        # Run in standalone mode, on uvloop where available (not on Windows)
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(main())
+        else:
+            uvloop.run(main())
     else:
         # Run FastAPI server
         uvicorn.run(
@@ -411,5 +555,9 @@ if __name__ == "__main__":
             host="0.0.0.0",
             port=8000,
             reload=False,
-            log_level="info"
+            loop="auto",
+            http="httptools",
+            workers=WEB_CONCURRENCY,
+            log_level="info",
+            access_log=False
         )
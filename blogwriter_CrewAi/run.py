@@ -1,6 +1,9 @@
 import os
 import asyncio
 import json
+import logging
+import signal
+from datetime import datetime
 from crewai import Agent, Task, Process, Crew
 from crewai_tools import SerperDevTool
 from dotenv import load_dotenv
@@ -9,13 +12,25 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 # Add src to path to allow for local imports
 import sys
 sys.path.insert(0, './src')
+from config.logging_setup import setup_logging
 from database.connection import db_manager
 
+# Set up logging (written by a background thread, off the event loop)
+setup_logging(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 load_dotenv()
 
 import re
 
+# JSON extraction helpers, built once at import time
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+# strict=False allows control characters within strings
+_DECODER = json.JSONDecoder(strict=False)
+# Words are counted by iterating matches rather than materializing a split list
+_WORD_RE = re.compile(r'\S+')
+
 
 # --- CrewAI setup ---
 def create_blog_writer_crew():
@@ -59,45 +74,58 @@ def create_blog_writer_crew():
     
     return blog_crew
 
+# The crew is built once and reused across scheduled runs
+_blog_crew = None
+
+def get_blog_writer_crew():
+    """Return the shared blog writer crew, creating it on first use."""
+    global _blog_crew
+    if _blog_crew is None:
+        _blog_crew = create_blog_writer_crew()
+    return _blog_crew
+
 # --- Main job function ---
 async def generate_and_save_blog():
     """The main async job to be scheduled."""
-    print("🚀 Starting blog generation job...")
+    logger.info("🚀 Starting blog generation job...")
     
     topic = "The Future of AI in Content Creation"
-    log_entry = None
     
     try:
-        # Log the start of the generation
         await db_manager.connect()
-        log_entry = await db_manager.log_generation_attempt(topic, 'in_progress')
         
-        crew = create_blog_writer_crew()
-        result_json_str = crew.kickoff(inputs={'topic': topic})
+        # Run the blocking crew kickoff in a worker thread to keep the event loop free
+        crew = get_blog_writer_crew()
+        result_json_str = await asyncio.to_thread(crew.kickoff, inputs={'topic': topic})
         
         # The result from a JSON output crew is a string, so we need to find and parse it.
         # The agent can sometimes add conversational text before or after the JSON.
-        json_match = re.search(r'\{.*\}', result_json_str, re.DOTALL)
-        
-        if not json_match:
-            raise ValueError("Could not extract valid JSON from the crew's output.")
-            
-        json_string = json_match.group(0)
-        
         try:
-            # The strict=False parameter allows for control characters within the string
-            result_data = json.loads(json_string, strict=False)
-        except json.JSONDecodeError as e:
-            print(f"Failed to decode JSON: {e}")
-            print(f"Problematic JSON string: {json_string}")
-            raise
+            # Common case: decode directly from the first brace, ignoring trailing text
+            start = result_json_str.index('{')
+            result_data, _ = _DECODER.raw_decode(result_json_str, start)
+        except ValueError:
+            # Fall back to the outermost brace-delimited block
+            json_match = _JSON_RE.search(result_json_str)
+            
+            if not json_match:
+                raise ValueError("Could not extract valid JSON from the crew's output.")
+                
+            json_string = json_match.group(0)
+            
+            try:
+                result_data = _DECODER.decode(json_string)
+            except json.JSONDecodeError as e:
+                logger.error("Failed to decode JSON: %s", e)
+                logger.error("Problematic JSON string: %s", json_string)
+                raise
 
 
         if result_data and all(k in result_data for k in ['title', 'content', 'tags', 'meta_description']):
-            word_count = len(result_data['content'].split())
+            word_count = sum(1 for _ in _WORD_RE.finditer(result_data['content']))
             
-            # Save the blog post
-            blog_post = await db_manager.create_blog_post(
+            # Save the blog post and its success log in a single transaction
+            blog_post = await db_manager.create_blog_post_with_log(
                 title=result_data['title'],
                 content=result_data['content'],
                 topic=topic,
@@ -105,60 +133,67 @@ async def generate_and_save_blog():
                 word_count=word_count,
                 meta_description=result_data['meta_description']
             )
-
-            if blog_post:
-                # Update the log to success
-                await db_manager.log_generation_attempt(topic, 'success', blog_post_id=blog_post.id)
-                print(f"✅ Blog post on '{topic}' saved to the database.")
-            else:
-                # Update the log to failed if post saving failed
-                await db_manager.log_generation_attempt(topic, 'failed', error_msg="Failed to save blog post to DB.")
-                print("❌ Failed to save blog post to the database.")
+            
+            if not blog_post:
+                raise RuntimeError("Failed to save the blog post to the database.")
+            
+            logger.info("✅ Blog post on '%s' saved to the database.", topic)
 
         else:
-            # Update the log to failed if result is invalid
+            # Log the failure if result is invalid
             await db_manager.log_generation_attempt(topic, 'failed', error_msg="Generated content was invalid or incomplete.")
-            print("❌ Blog generation returned invalid or incomplete content.")
+            logger.error("❌ Blog generation returned invalid or incomplete content.")
 
     except Exception as e:
-        print(f"An error occurred during blog generation: {e}")
-        if log_entry:
-            # Update the log to failed on exception
+        logger.exception("An error occurred during blog generation: %s", e)
+        if db_manager.connected:
+            # Log the failure on exception
             await db_manager.log_generation_attempt(topic, 'failed', error_msg=str(e))
-    finally:
-        if db_manager._connected:
-            await db_manager.disconnect()
 
-    print("✅ Blog generation job finished.")
+    logger.info("✅ Blog generation job finished.")
 
 # --- Scheduler setup ---
 async def main():
     """Main function to run the scheduled job."""
-    print("📅 Initializing blog generation scheduler...")
+    logger.info("📅 Initializing blog generation scheduler...")
     
     scheduler = AsyncIOScheduler()
     
-    # Schedule the job to run every 10 minutes
-    scheduler.add_job(generate_and_save_blog, 'interval', minutes=10)
+    # Pay the crew construction and database connect costs once, before the
+    # first run; the connection stays open across runs until shutdown
+    await asyncio.gather(
+        asyncio.to_thread(get_blog_writer_crew),
+        db_manager.connect()
+    )
+    
+    # Schedule the job to run every 10 minutes, starting immediately. A single
+    # job with max_instances=1 and coalescing never stacks overlapping runs.
+    scheduler.add_job(
+        generate_and_save_blog, 'interval', minutes=10,
+        next_run_time=datetime.now(),
+        coalesce=True, max_instances=1, misfire_grace_time=60
+    )
     
-    # Run the job once immediately
-    scheduler.add_job(generate_and_save_blog, 'date')
+    # Stop cleanly on Ctrl+C or SIGTERM without polling
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
     
     scheduler.start()
     
-    print("⏰ Scheduler started. Press Ctrl+C to exit.")
+    logger.info("⏰ Scheduler started. Press Ctrl+C to exit.")
     
-    # Keep the script running
+    # Keep the script running until a stop signal arrives
     try:
-        while True:
-            await asyncio.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
+        await stop_event.wait()
+    finally:
         scheduler.shutdown()
-        if db_manager._connected:
-            await db_manager.disconnect()
+        await db_manager.ensure_disconnected()
+        logger.info("Scheduler stopped.")
 
 if __name__ == "__main__":
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\nScheduler stopped.")
+        logger.info("Scheduler stopped.")
@@ -3,29 +3,265 @@
 import asyncio
 import logging
 import re
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, NamedTuple, TYPE_CHECKING
+from datetime import datetime, timezone
 import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 
-from crewai import Agent, Task, Process, Crew
-from crewai_tools import SerperDevTool
 from dotenv import load_dotenv
 import os
 
-from .database.connection import db_manager, save_blog_post, log_generation
+from .database.connection import db_manager, log_generation
+from .cache.response_cache import response_cache
+
+# crewai and crewai_tools pull in a large import graph; they are imported
+# where first used so importing this module stays cheap
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+    from crewai_tools import SerperDevTool
 
 # Load environment variables
 load_dotenv()
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint
 logger = logging.getLogger(__name__)
 
+# Patterns used when assembling blog components, compiled once at import
+# Title, **Tags:** and meta description lines are found in one scan; each
+# alternative captures a single named group, so match.lastgroup names it.
+# The lookahead keeps matches zero-width so overlapping lines are not skipped.
+_BLOG_EXTRACT_RE = re.compile(
+    r"(?=^#\s+(?P<title>.+?)(?:\n|$)"
+    r"|\*\*Tags:\*\*\s*(?P<tags>.+?)(?:\n|$)"
+    r"|(?:Meta Description|meta description):\s*(?P<meta>.+?)(?:\n|$))",
+    re.MULTILINE | re.IGNORECASE
+)
+_TITLE_FALLBACK_RES = [
+    re.compile(r"(?:Title|TITLE):\s*(.+?)(?:\n|$)", re.MULTILINE | re.IGNORECASE),
+    re.compile(r"(?:^|\n)([A-Z][^.\n]+(?:AI|Technology|Intelligence|Machine Learning|Deep Learning)[^.\n]*)", re.MULTILINE | re.IGNORECASE),
+]
+# Tried only when there is no **Tags:** line; also covers "Suggested tags:"
+# and "Relevant tags:", which end in "tags:"
+_TAGS_FALLBACK_RE = re.compile(r"(?:Tags|TAGS|Keywords):\s*(.+?)(?:\n|$)", re.MULTILINE | re.IGNORECASE)
+_SPLIT_TAGS_RE = re.compile(r'[,;|]')
+_META_DESC_LINE_RE = re.compile(r'(?:Meta Description|meta description):\s*.+?(?:\n|$)', re.IGNORECASE)
+# Year used in topic phrasing, fixed for the life of the process
+_YEAR = datetime.now(timezone.utc).year
+
+# Trending angles appended to base topics, with the year already inlined
+_TRENDING_ASPECTS = (
+    f"in {_YEAR}",
+    "latest trends and innovations",
+    "breaking developments",
+    "industry impact and future prospects",
+    "practical applications and use cases",
+    "challenges and opportunities ahead"
+)
+
+# Themes picked from when none is requested
+_THEMES = ("genai", "blockchain")
+
+# Markdown syntax characters ignored when counting words
+_MD_STRIP_TABLE = str.maketrans('', '', '#*`[]()')
+
+# Static prompt scaffolding. Task descriptions put these byte-identical
+# blocks first and the topic last, so the provider's automatic prompt
+# prefix cache (OpenAI caches prompts over 1024 tokens) can match them
+# across runs.
+_MARKDOWN_EXAMPLE = """
+            Markdown Structure Example:
+            # Your Compelling Title Here
+            
+            ## Introduction
+            Your engaging introduction here...
+            
+            ## Main Section 1
+            Content with **bold** and *italic* emphasis...
+            
+            ### Subsection
+            - Bullet points for clarity
+            - Key statistics and facts
+            
+            ## Conclusion
+            Strong conclusion with actionable insights...
+"""
+
+# Task descriptions, built once at import. Static scaffolding comes first
+# and only the topic is interpolated at the end.
+_RESEARCH_FOCUS_AREAS = {
+    "blockchain": """
+            Focus on these key areas:
+            1. Latest blockchain/cryptocurrency developments and breakthroughs (2-3 key points)
+            2. Major blockchain platforms, protocols, and projects involved
+            3. Current market trends, adoption rates, and trading volumes
+            4. Real-world applications, use cases, and institutional adoption
+            5. Regulatory developments and compliance considerations
+            """,
+    "genai": """
+            Focus on these key areas:
+            1. Latest AI developments and breakthroughs (2-3 key points)
+            2. Major companies and technologies involved
+            3. Current market trends and adoption
+            4. Real-world applications and use cases
+            """,
+}
+
+_RESEARCH_TEMPLATES = {
+    theme: f"""
+            {focus_areas}
+            
+            Keep your research summary concise but informative - aim for 200-300 words maximum.
+            Include 2-3 key statistics or facts.
+            
+            Research the latest information about: {{topic}}
+            """
+    for theme, focus_areas in _RESEARCH_FOCUS_AREAS.items()
+}
+
+_WRITING_GUIDANCE = {
+    "blockchain": ("""
+            Content should cover:
+            - Technical aspects of blockchain/cryptocurrency technology
+            - Market analysis and price movements (if relevant)
+            - Regulatory landscape and compliance considerations
+            - Real-world adoption and use cases
+            - Security implications and best practices
+            - Future outlook and industry predictions
+            
+            Use appropriate blockchain terminology and explain technical concepts clearly.
+            Include relevant market data, adoption statistics, and regulatory updates.
+            """, "**Tags:** Blockchain, Cryptocurrency, DeFi, Web3, Smart Contracts"),
+    "genai": ("""
+            Content should cover:
+            - Technical developments in AI/ML
+            - Industry applications and use cases
+            - Ethical considerations and challenges
+            - Future implications and predictions
+            - Practical implementation examples
+            
+            Use appropriate AI/ML terminology and explain technical concepts clearly.
+            Include relevant research findings, adoption statistics, and industry insights.
+            """, "**Tags:** Generative AI, Machine Learning, Artificial Intelligence, Technology, Innovation"),
+}
+
+_WRITING_TEMPLATES = {
+    theme: f"""
+            IMPORTANT: Format the output as proper Markdown for web publishing.
+            
+            Requirements:
+            1. Write 800-1200 words (concise but comprehensive)
+            2. Start with a compelling title using # header
+            3. Include an engaging introduction (2-3 paragraphs)
+            4. Use ## for main sections and ### for subsections
+            5. Include practical examples and real-world applications
+            6. Add relevant statistics and facts from research
+            7. Write in an accessible, professional tone
+            8. End with a strong conclusion and key takeaways
+            9. Include 5-7 relevant tags at the end using **Tags:** format
+            {_MARKDOWN_EXAMPLE}
+            Keep content focused and avoid overly long sections to prevent token limits.
+            
+            {content_guidance}
+            
+            {tags_example}
+            
+            Write a well-structured blog post about: {{topic}}
+            """
+    for theme, (content_guidance, tags_example) in _WRITING_GUIDANCE.items()
+}
+
+_EDITING_DESCRIPTION = """
+            Edit and optimize the blog post for web publication:
+            
+            1. Ensure perfect Markdown formatting for web display
+            2. Review for grammar, spelling, and readability
+            3. Verify proper heading hierarchy (# ## ###)
+            4. Check that all sections flow logically
+            5. Ensure consistent tone and professional style
+            6. Optimize for web readability (short paragraphs, bullet points)
+            7. Verify all facts and statistics are accurate
+            8. Add meta description suggestion (150-160 characters)
+            
+            Output the final blog post in clean Markdown format ready for web publishing.
+            Include a suggested meta description at the end.
+            """
+
+_RESEARCH_EXPECTED_OUTPUT = "A concise research summary (200-300 words) with key findings and statistics about the topic."
+_WRITING_EXPECTED_OUTPUT = "A complete 800-1200 word blog post in proper Markdown format with title, structured content, and tags."
+_EDITING_EXPECTED_OUTPUT = "A polished blog post in perfect Markdown format ready for web publication, with meta description."
+
+# Bounded pool for CPU-bound markdown post-processing, kept separate from the
+# default executor that runs crew kickoffs
+_MARKDOWN_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="markdown")
+
+async def run_markdown_task(func, *args, **kwargs):
+    """Run CPU-bound markdown processing on the markdown pool, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_MARKDOWN_EXECUTOR, partial(func, *args, **kwargs))
+
+# Default and theme-correction tag sets, shared instead of rebuilt per extraction
+_BLOCKCHAIN_DEFAULT_TAGS = ("Blockchain", "Cryptocurrency", "Web3", "Decentralized Finance", "Technology")
+_BLOCKCHAIN_OVERRIDE_TAGS = ("Blockchain", "Cryptocurrency", "Web3", "Technology", "Innovation")
+_GENAI_DEFAULT_TAGS = ("Generative AI", "Artificial Intelligence", "Technology", "Machine Learning", "Innovation")
+_FALLBACK_TAGS = ("Generative AI", "Technology")
+
+# Proper capitalization for common tags, keyed by lowercased tag
+_TAG_MAPPING = {
+    'blockchain': 'Blockchain',
+    'cryptocurrency': 'Cryptocurrency',
+    'bitcoin': 'Bitcoin',
+    'ethereum': 'Ethereum',
+    'defi': 'DeFi',
+    'nft': 'NFT',
+    'web3': 'Web3',
+    'dao': 'DAO',
+    'smart contracts': 'Smart Contracts',
+    'smart contract': 'Smart Contracts',
+    'ai': 'Artificial Intelligence',
+    'artificial intelligence': 'Artificial Intelligence',
+    'machine learning': 'Machine Learning',
+    'deep learning': 'Deep Learning',
+    'llm': 'Large Language Models',
+    'generative ai': 'Generative AI',
+    'technology': 'Technology',
+    'innovation': 'Innovation'
+}
+
+# Keywords that mark content as blockchain-themed
+_BLOCKCHAIN_KEYWORDS = (
+    'blockchain', 'bitcoin', 'cryptocurrency', 'defi', 'nft', 'ethereum',
+    'smart contract', 'decentralized', 'web3', 'dao', 'cbdc', 'tokenization',
+    'consensus', 'mining', 'wallet', 'dapp', 'protocol'
+)
+
+class BlogComponents(NamedTuple):
+    """Blog post parts extracted from crew output."""
+    title: str
+    content: str
+    tags: List[str]
+    word_count: int
+    meta_description: Optional[str]
+
+# Line prefixes of headers that ensure_proper_markdown keeps as-is
+_HEADER_PREFIXES = frozenset(('# ', '##'))
+
+def _transform_line(line: str) -> str:
+    """Normalize a single stripped markdown line."""
+    # Empty lines and markdown headers pass through unchanged
+    if not line or line[:2] in _HEADER_PREFIXES:
+        return line
+    # Convert short all-caps lines into proper section headers
+    if line.isupper() and len(line.split()) <= 5:
+        return f"## {line.title()}"
+    return line
+
 class EnhancedBlogGenerator:
     """Enhanced blog generator with dynamic topic generation and database integration."""
     
     # Diverse generative AI topics for dynamic content
-    GENERATIVE_AI_TOPICS = [
+    GENERATIVE_AI_TOPICS = (
         "Large Language Models (LLMs) and their latest developments",
         "Retrieval-Augmented Generation (RAG) systems and applications",
         "AI Agents and autonomous systems",
@@ -46,10 +282,10 @@ class EnhancedBlogGenerator:
         "AI-powered automation tools and workflows",
         "Generative AI in healthcare and medical applications",
         "AI in education and personalized learning systems"
-    ]
+    )
     
     # Comprehensive blockchain topics for dynamic content
-    BLOCKCHAIN_TOPICS = [
+    BLOCKCHAIN_TOPICS = (
         "Bitcoin and cryptocurrency market developments",
         "Ethereum 2.0 and proof-of-stake consensus mechanisms",
         "Decentralized Finance (DeFi) protocols and innovations",
@@ -70,14 +306,64 @@ class EnhancedBlogGenerator:
         "Blockchain in healthcare and medical record management",
         "Decentralized storage solutions and data sovereignty",
         "Blockchain adoption in enterprise and institutional settings"
-    ]
+    )
+    
+    # Random themes are weighted by how many topics each offers
+    _THEME_CUM_WEIGHTS = (len(GENERATIVE_AI_TOPICS), len(GENERATIVE_AI_TOPICS) + len(BLOCKCHAIN_TOPICS))
+    
+    # Every base topic/trending aspect combination per theme, built once
+    _TOPIC_COMBINATIONS = {
+        "genai": tuple(f"{base_topic} - {aspect}" for base_topic in GENERATIVE_AI_TOPICS for aspect in _TRENDING_ASPECTS),
+        "blockchain": tuple(f"{base_topic} - {aspect}" for base_topic in BLOCKCHAIN_TOPICS for aspect in _TRENDING_ASPECTS)
+    }
     
     def __init__(self):
-        self.search_tool = SerperDevTool()
-        self.setup_agents()
+        # Shuffled, not-yet-used topics per theme; refilled when exhausted
+        self._topic_pools: Dict[str, deque] = {}
+        # Shared agents, created on first use (see setup_agents)
+        self._agents: Optional[Tuple["Agent", "Agent", "Agent"]] = None
+    
+    @cached_property
+    def search_tool(self) -> "SerperDevTool":
+        """Shared web search tool, created on first use."""
+        from crewai_tools import SerperDevTool
+        return SerperDevTool()
+    
+    def warm_up(self):
+        """Import CrewAI and create the shared search tool ahead of the first generation."""
+        import crewai  # noqa: F401
+        self.search_tool
     
     def setup_agents(self):
-        """Set up CrewAI agents."""
+        """Set up the shared CrewAI agents."""
+        self._agents = self.create_agents()
+    
+    @property
+    def shared_agents(self) -> Tuple["Agent", "Agent", "Agent"]:
+        """Shared research, writer, and editor agents, set up on first access."""
+        if self._agents is None:
+            self.setup_agents()
+        return self._agents
+    
+    @property
+    def research_agent(self) -> "Agent":
+        """Shared research agent."""
+        return self.shared_agents[0]
+    
+    @property
+    def writer_agent(self) -> "Agent":
+        """Shared writer agent."""
+        return self.shared_agents[1]
+    
+    @property
+    def editor_agent(self) -> "Agent":
+        """Shared editor agent."""
+        return self.shared_agents[2]
+    
+    def create_agents(self) -> Tuple["Agent", "Agent", "Agent"]:
+        """Create a new set of research, writer, and editor agents."""
+        from crewai import Agent
+        
         # Use GPT-3.5-turbo for more efficient token usage
         model_config = {
             "model": "gpt-4o",  # Higher token limit variant
@@ -85,7 +371,7 @@ class EnhancedBlogGenerator:
             "max_tokens": 1500  # Limit response length
         }
         
-        self.research_agent = Agent(
+        research_agent = Agent(
             role="Technology Research Specialist",
             goal="Research the latest trends and developments in AI and blockchain technology efficiently.",
             backstory="You are a technology researcher who creates concise, informative summaries of the latest developments in AI, blockchain, and emerging technologies. You have deep knowledge of both generative AI and blockchain ecosystems.",
@@ -95,17 +381,16 @@ class EnhancedBlogGenerator:
             llm_config=model_config
         )
         
-        self.writer_agent = Agent(
+        writer_agent = Agent(
             role="Senior Tech Blog Writer",
             goal="Write well-structured, engaging blog posts about AI and blockchain technology in proper markdown format.",
             backstory="You are an experienced technology writer who creates clear, informative content about AI, blockchain, cryptocurrency, and emerging technologies. You can adapt your writing style for both technical AI topics and blockchain/crypto subjects.",
             verbose=False,
             allow_delegation=False,
-            tools=[self.search_tool],
             llm_config=model_config
         )
         
-        self.editor_agent = Agent(
+        editor_agent = Agent(
             role="Content Editor and SEO Specialist",
             goal="Edit and optimize blog content for web publication with proper markdown formatting.",
             backstory="You are a content editor who ensures all content is polished, properly formatted, and optimized for web publication. You have experience editing both AI and blockchain content.",
@@ -113,6 +398,12 @@ class EnhancedBlogGenerator:
             allow_delegation=False,
             llm_config=model_config
         )
+        
+        return research_agent, writer_agent, editor_agent
+    
+    def _random_theme(self) -> str:
+        """Pick a theme at random, weighted by topic count."""
+        return random.choices(_THEMES, cum_weights=self._THEME_CUM_WEIGHTS)[0]
     
     def generate_dynamic_topic(self, theme: Optional[str] = None) -> str:
         """Generate a dynamic topic for blog generation.
@@ -122,166 +413,79 @@ class EnhancedBlogGenerator:
         """
         # Randomly select theme if not provided
         if not theme:
-            theme = random.choice(["genai", "blockchain"])
-            
-        if theme.lower() == "blockchain":
-            base_topic = random.choice(self.BLOCKCHAIN_TOPICS)
-        else:
-            base_topic = random.choice(self.GENERATIVE_AI_TOPICS)
+            theme = self._random_theme()
         
-        # Add current context or trending aspects
-        current_year = datetime.now().year
-        trending_aspects = [
-            f"in {current_year}",
-            "latest trends and innovations",
-            "breaking developments",
-            "industry impact and future prospects",
-            "practical applications and use cases",
-            "challenges and opportunities ahead"
-        ]
+        theme = "blockchain" if theme.lower() == "blockchain" else "genai"
         
-        aspect = random.choice(trending_aspects)
-        return f"{base_topic} - {aspect}"
+        # Draw without replacement so no topic repeats until the pool is used up
+        pool = self._topic_pools.get(theme)
+        if not pool:
+            pool = self._refill_topic_pool(theme)
+        return pool.popleft()
     
-    def create_research_task(self, topic: str, theme: str = "genai") -> Task:
+    def _refill_topic_pool(self, theme: str) -> deque:
+        """Shuffle every base topic/trending aspect combination for a theme into a fresh pool.
+        
+        Args:
+            theme: The normalized theme ('genai' or 'blockchain')
+        """
+        topics = list(self._TOPIC_COMBINATIONS[theme])
+        random.shuffle(topics)
+        
+        pool = self._topic_pools[theme] = deque(topics)
+        return pool
+    
+    def create_research_task(self, topic: str, theme: str = "genai", agent: Optional["Agent"] = None) -> "Task":
         """Create a research task for the given topic.
         
         Args:
             topic: The specific topic to research
             theme: The theme context ('genai' or 'blockchain')
+            agent: Agent to assign (defaults to the shared research agent)
         """
-        if theme.lower() == "blockchain":
-            focus_areas = """
-            Focus on these key areas:
-            1. Latest blockchain/cryptocurrency developments and breakthroughs (2-3 key points)
-            2. Major blockchain platforms, protocols, and projects involved
-            3. Current market trends, adoption rates, and trading volumes
-            4. Real-world applications, use cases, and institutional adoption
-            5. Regulatory developments and compliance considerations
-            """
-        else:
-            focus_areas = """
-            Focus on these key areas:
-            1. Latest AI developments and breakthroughs (2-3 key points)
-            2. Major companies and technologies involved
-            3. Current market trends and adoption
-            4. Real-world applications and use cases
-            """
+        from crewai import Task
+        
+        template = _RESEARCH_TEMPLATES["blockchain" if theme.lower() == "blockchain" else "genai"]
         
         return Task(
-            description=f"""
-            Research the latest information about: {topic}
-            
-            {focus_areas}
-            
-            Keep your research summary concise but informative - aim for 200-300 words maximum.
-            Include 2-3 key statistics or facts.
-            """,
-            expected_output="A concise research summary (200-300 words) with key findings and statistics about the topic.",
-            agent=self.research_agent,
+            description=template.format(topic=topic),
+            expected_output=_RESEARCH_EXPECTED_OUTPUT,
+            agent=agent or self.research_agent,
         )
     
-    def create_writing_task(self, topic: str, theme: str = "genai") -> Task:
+    def create_writing_task(self, topic: str, theme: str = "genai", agent: Optional["Agent"] = None) -> "Task":
         """Create a writing task for the given topic.
         
         Args:
             topic: The specific topic to write about
             theme: The theme context ('genai' or 'blockchain')
+            agent: Agent to assign (defaults to the shared writer agent)
         """
-        if theme.lower() == "blockchain":
-            content_guidance = """
-            Content should cover:
-            - Technical aspects of blockchain/cryptocurrency technology
-            - Market analysis and price movements (if relevant)
-            - Regulatory landscape and compliance considerations
-            - Real-world adoption and use cases
-            - Security implications and best practices
-            - Future outlook and industry predictions
-            
-            Use appropriate blockchain terminology and explain technical concepts clearly.
-            Include relevant market data, adoption statistics, and regulatory updates.
-            """
-            tags_example = "**Tags:** Blockchain, Cryptocurrency, DeFi, Web3, Smart Contracts"
-        else:
-            content_guidance = """
-            Content should cover:
-            - Technical developments in AI/ML
-            - Industry applications and use cases
-            - Ethical considerations and challenges
-            - Future implications and predictions
-            - Practical implementation examples
-            
-            Use appropriate AI/ML terminology and explain technical concepts clearly.
-            Include relevant research findings, adoption statistics, and industry insights.
-            """
-            tags_example = "**Tags:** Generative AI, Machine Learning, Artificial Intelligence, Technology, Innovation"
+        from crewai import Task
+        
+        template = _WRITING_TEMPLATES["blockchain" if theme.lower() == "blockchain" else "genai"]
         
         return Task(
-            description=f"""
-            Write a well-structured blog post about: {topic}
-            
-            IMPORTANT: Format the output as proper Markdown for web publishing.
-            
-            {content_guidance}
-            
-            Requirements:
-            1. Write 800-1200 words (concise but comprehensive)
-            2. Start with a compelling title using # header
-            3. Include an engaging introduction (2-3 paragraphs)
-            4. Use ## for main sections and ### for subsections
-            5. Include practical examples and real-world applications
-            6. Add relevant statistics and facts from research
-            7. Write in an accessible, professional tone
-            8. End with a strong conclusion and key takeaways
-            9. Include 5-7 relevant tags at the end using **Tags:** format
-            
-            Markdown Structure Example:
-            # Your Compelling Title Here
-            
-            ## Introduction
-            Your engaging introduction here...
-            
-            ## Main Section 1
-            Content with **bold** and *italic* emphasis...
-            
-            ### Subsection
-            - Bullet points for clarity
-            - Key statistics and facts
-            
-            ## Conclusion
-            Strong conclusion with actionable insights...
-            
-            {tags_example}
-            
-            Keep content focused and avoid overly long sections to prevent token limits.
-            """,
-            expected_output="A complete 800-1200 word blog post in proper Markdown format with title, structured content, and tags.",
-            agent=self.writer_agent,
+            description=template.format(topic=topic),
+            expected_output=_WRITING_EXPECTED_OUTPUT,
+            agent=agent or self.writer_agent,
         )
     
-    def create_editing_task(self) -> Task:
-        """Create an editing and optimization task."""
+    def create_editing_task(self, agent: Optional["Agent"] = None) -> "Task":
+        """Create an editing and optimization task.
+        
+        Args:
+            agent: Agent to assign (defaults to the shared editor agent)
+        """
+        from crewai import Task
+        
         return Task(
-            description="""
-            Edit and optimize the blog post for web publication:
-            
-            1. Ensure perfect Markdown formatting for web display
-            2. Review for grammar, spelling, and readability
-            3. Verify proper heading hierarchy (# ## ###)
-            4. Check that all sections flow logically
-            5. Ensure consistent tone and professional style
-            6. Optimize for web readability (short paragraphs, bullet points)
-            7. Verify all facts and statistics are accurate
-            8. Add meta description suggestion (150-160 characters)
-            
-            Output the final blog post in clean Markdown format ready for web publishing.
-            Include a suggested meta description at the end.
-            """,
-            expected_output="A polished blog post in perfect Markdown format ready for web publication, with meta description.",
-            agent=self.editor_agent,
+            description=_EDITING_DESCRIPTION,
+            expected_output=_EDITING_EXPECTED_OUTPUT,
+            agent=agent or self.editor_agent,
         )
     
-    def extract_blog_components(self, crew_output: str, theme: str = "genai") -> Dict[str, Any]:
+    def extract_blog_components(self, crew_output: str, theme: str = "genai") -> BlogComponents:
         """Extract title, content, and tags from crew output.
         
         Args:
@@ -292,19 +496,19 @@ class EnhancedBlogGenerator:
             # Clean the output
             content = crew_output.strip()
             
+            # Single pass collecting the first title, tags and meta description lines
+            found = {}
+            for match in _BLOG_EXTRACT_RE.finditer(content):
+                found.setdefault(match.lastgroup, match.group(match.lastgroup))
+            
             # Extract title from markdown (look for # header)
-            title_match = re.search(r'^#\s+(.+?)(?:\n|$)', content, re.MULTILINE)
-            if title_match:
-                title = title_match.group(1).strip()
+            if 'title' in found:
+                title = found['title'].strip()
             else:
                 # Fallback title patterns
-                title_patterns = [
-                    r"(?:Title|TITLE):\s*(.+?)(?:\n|$)",
-                    r"(?:^|\n)([A-Z][^.\n]+(?:AI|Technology|Intelligence|Machine Learning|Deep Learning)[^.\n]*)",
-                ]
                 title = "Latest Developments in Generative AI"  # Default title
-                for pattern in title_patterns:
-                    match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
+                for pattern in _TITLE_FALLBACK_RES:
+                    match = pattern.search(content)
                     if match:
                         title = match.group(1).strip()
                         break
@@ -313,197 +517,186 @@ class EnhancedBlogGenerator:
             title = title.strip('"\'')  # Remove quotes
             
             # Extract tags (look for **Tags:** pattern first, then fallback patterns)
-            tags_patterns = [
-                r"\*\*Tags:\*\*\s*(.+?)(?:\n|$)",
-                r"(?:Tags|TAGS|Keywords):\s*(.+?)(?:\n|$)",
-                r"(?:Suggested tags|Relevant tags):\s*(.+?)(?:\n|$)",
-            ]
-            
             tags = []
-            for pattern in tags_patterns:
-                match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
+            tags_text = found.get('tags')
+            if tags_text is None:
+                match = _TAGS_FALLBACK_RE.search(content)
                 if match:
                     tags_text = match.group(1)
-                    # Split by common delimiters
-                    tags = [tag.strip().strip(',').strip() for tag in re.split(r'[,;|]', tags_text)]
-                    tags = [tag for tag in tags if tag and len(tag) > 1]
-                    
-                    # Normalize tag capitalization for consistency
-                    normalized_tags = []
-                    for tag in tags:
-                        tag_lower = tag.lower()
-                        # Map common tags to proper capitalization
-                        tag_mapping = {
-                            'blockchain': 'Blockchain',
-                            'cryptocurrency': 'Cryptocurrency', 
-                            'bitcoin': 'Bitcoin',
-                            'ethereum': 'Ethereum',
-                            'defi': 'DeFi',
-                            'nft': 'NFT',
-                            'web3': 'Web3',
-                            'dao': 'DAO',
-                            'smart contracts': 'Smart Contracts',
-                            'smart contract': 'Smart Contracts',
-                            'ai': 'Artificial Intelligence',
-                            'artificial intelligence': 'Artificial Intelligence',
-                            'machine learning': 'Machine Learning',
-                            'deep learning': 'Deep Learning',
-                            'llm': 'Large Language Models',
-                            'generative ai': 'Generative AI',
-                            'technology': 'Technology',
-                            'innovation': 'Innovation'
-                        }
-                        
-                        normalized_tag = tag_mapping.get(tag_lower, tag.title())
-                        normalized_tags.append(normalized_tag)
-                    
-                    tags = normalized_tags
-                    break
+            
+            if tags_text is not None:
+                # Split by common delimiters
+                tags = [tag.strip().strip(',').strip() for tag in _SPLIT_TAGS_RE.split(tags_text)]
+                tags = [tag for tag in tags if tag and len(tag) > 1]
+                
+                # Normalize tag capitalization for consistency
+                tags = [_TAG_MAPPING.get(tag.lower(), tag.title()) for tag in tags]
             
             # Default tags if none found - theme-aware
             if not tags:
-                if theme.lower() == "blockchain":
-                    tags = ["Blockchain", "Cryptocurrency", "Web3", "Decentralized Finance", "Technology"]
-                else:
-                    tags = ["Generative AI", "Artificial Intelligence", "Technology", "Machine Learning", "Innovation"]
+                tags = _BLOCKCHAIN_DEFAULT_TAGS if theme.lower() == "blockchain" else _GENAI_DEFAULT_TAGS
             
             # Auto-detect theme from content if tags don't match theme
-            blockchain_keywords = [
-                'blockchain', 'bitcoin', 'cryptocurrency', 'defi', 'nft', 'ethereum', 
-                'smart contract', 'decentralized', 'web3', 'dao', 'cbdc', 'tokenization',
-                'consensus', 'mining', 'wallet', 'dapp', 'protocol'
-            ]
-            
             content_lower = content.lower()
             title_lower = title.lower()
             
             # Check if content is actually blockchain-themed
-            is_blockchain_content = any(keyword in content_lower or keyword in title_lower for keyword in blockchain_keywords)
+            is_blockchain_content = any(keyword in content_lower or keyword in title_lower for keyword in _BLOCKCHAIN_KEYWORDS)
             
             # Override tags if content theme doesn't match provided theme
             if is_blockchain_content and theme.lower() != "blockchain":
                 # Content is blockchain but theme was genai - fix the tags
-                tags = ["Blockchain", "Cryptocurrency", "Web3", "Technology", "Innovation"]
+                tags = _BLOCKCHAIN_OVERRIDE_TAGS
             elif not is_blockchain_content and theme.lower() == "blockchain":
                 # Content is genai but theme was blockchain - fix the tags  
-                tags = ["Generative AI", "Artificial Intelligence", "Technology", "Machine Learning", "Innovation"]
+                tags = _GENAI_DEFAULT_TAGS
             
             # Extract meta description if present
-            meta_desc_match = re.search(r'(?:Meta Description|meta description):\s*(.+?)(?:\n|$)', content, re.IGNORECASE)
-            meta_description = meta_desc_match.group(1).strip() if meta_desc_match else None
+            meta_description = found['meta'].strip() if 'meta' in found else None
             
             # Clean content for better web display
             # Remove any meta description lines from the main content
             if meta_description:
-                content = re.sub(r'(?:Meta Description|meta description):\s*.+?(?:\n|$)', '', content, flags=re.IGNORECASE)
+                content = _META_DESC_LINE_RE.sub('', content)
             
             # Ensure proper markdown formatting
             content = self.ensure_proper_markdown(content)
             
             # Calculate word count (excluding markdown syntax)
-            text_only = re.sub(r'[#*`\[\]()]', '', content)
+            text_only = content.translate(_MD_STRIP_TABLE)
             word_count = len(text_only.split())
             
-            return {
-                "title": title,
-                "content": content,
-                "tags": tags[:7],  # Limit to 7 tags
-                "word_count": word_count,
-                "meta_description": meta_description
-            }
+            return BlogComponents(
+                title=title,
+                content=content,
+                tags=list(tags[:7]),  # Limit to 7 tags
+                word_count=word_count,
+                meta_description=meta_description
+            )
             
         except Exception as e:
-            logger.error(f"Error extracting blog components: {e}")
-            return {
-                "title": "Generated Blog Post on Generative AI",
-                "content": crew_output,
-                "tags": ["Generative AI", "Technology"],
-                "word_count": len(crew_output.split()),
-                "meta_description": None
-            }
+            logger.error("Error extracting blog components: %s", e)
+            return BlogComponents(
+                title="Generated Blog Post on Generative AI",
+                content=crew_output,
+                tags=list(_FALLBACK_TAGS),
+                word_count=len(crew_output.split()),
+                meta_description=None
+            )
     
     def ensure_proper_markdown(self, content: str) -> str:
         """Ensure the content has proper markdown formatting."""
         try:
-            # Split into lines for processing
-            lines = content.split('\n')
-            processed_lines = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    processed_lines.append('')
-                    continue
-                
-                # Ensure main title starts with single #
-                if line.startswith('# ') and not line.startswith('## '):
-                    processed_lines.append(line)
-                # Ensure section headers are properly formatted
-                elif line.startswith('##') or line.startswith('###'):
-                    processed_lines.append(line)
-                # Convert unformatted headers to proper markdown
-                elif line.isupper() and len(line.split()) <= 5:
-                    processed_lines.append(f"## {line.title()}")
-                else:
-                    processed_lines.append(line)
-            
-            return '\n'.join(processed_lines)
+            return '\n'.join([_transform_line(line.strip()) for line in content.split('\n')])
             
         except Exception as e:
-            logger.error(f"Error formatting markdown: {e}")
+            logger.error("Error formatting markdown: %s", e)
             return content
     
-    async def generate_blog_post(self, custom_topic: Optional[str] = None, theme: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Generate a blog post and save it to the database."""
+    def _on_task_complete(self, output: Any):
+        """Log one line per completed crew task."""
+        logger.info(
+            "Task complete: %s",
+            (getattr(output, 'description', '') or '').strip()[:80],
+            extra={"agent": getattr(output, 'agent', None)}
+        )
+    
+    async def generate_blog_post(
+        self,
+        custom_topic: Optional[str] = None,
+        theme: Optional[str] = None,
+        agents: Optional[Tuple["Agent", "Agent", "Agent"]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Generate a blog post and save it to the database.
+        
+        Args:
+            custom_topic: Topic to write about (defaults to a generated topic)
+            theme: The theme to use ('genai', 'blockchain', or None for random)
+            agents: Research, writer, and editor agents (defaults to a fresh set for this run)
+        """
         try:
             # Randomly select theme if not provided
             if not theme:
-                theme = random.choice(["genai", "blockchain"])
+                theme = self._random_theme()
             
             # Generate or use provided topic
             topic = custom_topic or self.generate_dynamic_topic(theme=theme)
-            logger.info(f"Generating blog post for topic: {topic} (theme: {theme})")
-            
-            # Log generation attempt
-            await log_generation(topic, "in_progress")
-            
-            # Create tasks with theme context
-            research_task = self.create_research_task(topic, theme=theme)
-            writing_task = self.create_writing_task(topic, theme=theme)
-            editing_task = self.create_editing_task()
-            
-            # Set up crew
-            crew = Crew(
-                agents=[self.research_agent, self.writer_agent, self.editor_agent],
-                tasks=[research_task, writing_task, editing_task],
-                verbose=True,
-                process=Process.sequential,
-            )
-            
-            # Generate content
-            logger.info("Starting blog generation process...")
-            result = crew.kickoff()
+            logger.info("Generating blog post for topic: %s (theme: %s)", topic, theme)
             
-            if not result:
-                await log_generation(topic, "failed", "No output generated from crew")
-                return None
+            # Reuse an earlier generation only for explicitly requested topics;
+            # scheduled and random-topic runs must always produce a new post
+            use_cache = custom_topic is not None
+            cached, topic_embedding = await response_cache.get(topic) if use_cache else (None, None)
             
-            # Extract components with theme context
-            blog_components = self.extract_blog_components(str(result), theme=theme)
+            if cached:
+                cached_post_id = cached.get("blog_post_id")
+                existing_post = await db_manager.get_blog_post(cached_post_id) if cached_post_id else None
+                
+                if existing_post:
+                    logger.info("Response cache hit for topic: %s (blog post %s)", topic, existing_post.id)
+                    return {
+                        "id": existing_post.id,
+                        "title": existing_post.title,
+                        "topic": existing_post.topic,
+                        "tags": existing_post.tags,
+                        "word_count": existing_post.wordCount,
+                        "created_at": existing_post.createdAt,
+                        "cached": True
+                    }
+                
+                logger.info("Response cache hit for topic: %s; saving cached content", topic)
+                blog_components = BlogComponents(*(cached[field] for field in BlogComponents._fields))
+            else:
+                from crewai import Crew, Process
+                
+                # Agents keep per-run state, so overlapping runs must not share them
+                research_agent, writer_agent, editor_agent = agents or self.create_agents()
+                
+                # Create tasks with theme context
+                research_task = self.create_research_task(topic, theme=theme, agent=research_agent)
+                writing_task = self.create_writing_task(topic, theme=theme, agent=writer_agent)
+                editing_task = self.create_editing_task(agent=editor_agent)
+                
+                # Set up crew
+                crew = Crew(
+                    agents=[research_agent, writer_agent, editor_agent],
+                    tasks=[research_task, writing_task, editing_task],
+                    verbose=False,
+                    process=Process.sequential,
+                    task_callback=self._on_task_complete,
+                )
+                
+                # Generate content (kickoff runs in a worker thread, keeping the event loop free)
+                logger.info("Starting blog generation process...")
+                result = await crew.kickoff_async()
+                
+                logger.info("Blog generation finished for topic: %s (usage: %s)", topic, getattr(crew, 'usage_metrics', None))
+                
+                if not result:
+                    await log_generation(topic, "failed", "No output generated from crew")
+                    return None
+                
+                # Extract components with theme context, off the event loop
+                blog_components = await run_markdown_task(self.extract_blog_components, str(result), theme=theme)
             
-            # Save to database
-            blog_post = await save_blog_post(
-                title=blog_components["title"],
-                content=blog_components["content"],
+            # Save the post and its success log in one transaction
+            blog_post = await db_manager.create_blog_post_with_log(
+                title=blog_components.title,
+                content=blog_components.content,
                 topic=topic,
-                tags=blog_components["tags"],
-                word_count=blog_components["word_count"],
-                meta_description=blog_components.get("meta_description")
+                tags=blog_components.tags,
+                word_count=blog_components.word_count,
+                meta_description=blog_components.meta_description
             )
             
             if blog_post:
-                await log_generation(topic, "success", blog_post_id=blog_post.id)
-                logger.info(f"Successfully generated and saved blog post: {blog_post.title}")
+                if use_cache:
+                    await response_cache.set(
+                        topic,
+                        {**blog_components._asdict(), "blog_post_id": blog_post.id},
+                        embedding=topic_embedding
+                    )
+                logger.info("Successfully generated and saved blog post: %s", blog_post.title)
                 
                 return {
                     "id": blog_post.id,
@@ -523,5 +716,37 @@ class EnhancedBlogGenerator:
             await log_generation(topic if 'topic' in locals() else "unknown", "failed", error_msg)
             return None
 
+    async def generate_blog_posts_batch(
+        self,
+        topics: List[str],
+        theme: Optional[str] = None,
+        max_concurrency: int = 5
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Generate blog posts for several topics concurrently.
+        
+        Args:
+            topics: Topics to write about
+            theme: The theme to use for every topic ('genai', 'blockchain', or None for random)
+            max_concurrency: Maximum number of crews running at once
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(topic: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.generate_blog_post(custom_topic=topic, theme=theme)
+        
+        results = await asyncio.gather(*(generate(topic) for topic in topics), return_exceptions=True)
+        
+        posts = []
+        for topic, result in zip(topics, results):
+            if isinstance(result, Exception):
+                logger.error("Batch generation failed for topic %s: %s", topic, result)
+                posts.append(None)
+            else:
+                posts.append(result)
+        
+        logger.info("Batch generation finished: %s/%s posts created", sum(1 for post in posts if post), len(topics))
+        return posts
+
 # Global blog generator instance
 blog_generator = EnhancedBlogGenerator()
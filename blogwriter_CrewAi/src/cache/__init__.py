@@ -0,0 +1 @@
+"""Caching utilities for the BlogWriter CrewAI application."""
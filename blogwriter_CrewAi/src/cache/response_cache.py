@@ -0,0 +1,203 @@
+"""Response cache for generated blog posts, keyed by topic.
+
+Lookups try an exact match on the normalized topic first and, when semantic
+matching is enabled (RESPONSE_CACHE_SEMANTIC=true with an OpenAI API key),
+fall back to the nearest previously cached topic by embedding cosine
+similarity.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import time
+from array import array
+from contextlib import closing
+from typing import Optional, Dict, Any, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Cache location and matching configuration
+DEFAULT_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "response_cache.sqlite3")
+SIMILARITY_THRESHOLD = 0.92
+EMBEDDING_MODEL = "text-embedding-3-small"
+CACHE_TTL = 7 * 24 * 60 * 60  # seconds; "latest trends" posts go stale
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    components TEXT NOT NULL,
+    embedding BLOB,
+    created_at REAL NOT NULL
+)
+"""
+
+def normalize_topic(topic: str) -> str:
+    """Lowercase a topic and collapse whitespace so trivial variants share a key."""
+    return " ".join(topic.lower().split())
+
+def topic_key(topic: str) -> str:
+    """Return the exact-match cache key for a topic."""
+    return hashlib.sha256(normalize_topic(topic).encode("utf-8")).hexdigest()
+
+def _cosine(a: array, b: array) -> float:
+    """Cosine similarity between two equal-length vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+class ResponseCache:
+    """SQLite-backed cache of generated blog components."""
+    
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        similarity_threshold: float = SIMILARITY_THRESHOLD,
+        ttl: float = CACHE_TTL,
+        semantic: Optional[bool] = None
+    ):
+        """Create the cache.
+        
+        Args:
+            path: SQLite database file
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            ttl: Seconds an entry stays valid
+            semantic: Enable embedding matching (defaults to RESPONSE_CACHE_SEMANTIC, and needs OPENAI_API_KEY)
+        """
+        self.path = path
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        if semantic is None:
+            semantic = bool(os.getenv("OPENAI_API_KEY")) and os.getenv("RESPONSE_CACHE_SEMANTIC", "false").lower() == "true"
+        self.semantic = semantic
+        self._embedding_client = None
+        self._initialized = False
+        self.hits = 0
+        self.misses = 0
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the table on first use."""
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+    
+    def _embed(self, topic: str) -> Optional[array]:
+        """Embed a normalized topic, or return None if embeddings are unavailable."""
+        if not self.semantic:
+            return None
+        
+        try:
+            if self._embedding_client is None:
+                from openai import OpenAI
+                self._embedding_client = OpenAI()
+            
+            response = self._embedding_client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=normalize_topic(topic)
+            )
+            return array("f", response.data[0].embedding)
+        
+        except Exception as e:
+            # Fall back to exact matching only
+            logger.warning("Topic embedding failed, disabling semantic cache: %s", e)
+            self.semantic = False
+            return None
+    
+    def _get_sync(self, topic: str) -> Tuple[Optional[Dict[str, Any]], Optional[array]]:
+        """Look up cached components for a topic and return them with the topic embedding (blocking)."""
+        cutoff = time.time() - self.ttl
+        
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT components FROM responses WHERE key = ? AND created_at >= ?",
+                (topic_key(topic), cutoff)
+            ).fetchone()
+            if row:
+                return orjson.loads(row[0]), None
+            
+            embedding = self._embed(topic)
+            if embedding is None:
+                return None, None
+            
+            best_score, best = 0.0, None
+            for components, blob in conn.execute(
+                "SELECT components, embedding FROM responses WHERE embedding IS NOT NULL AND created_at >= ?",
+                (cutoff,)
+            ):
+                candidate = array("f")
+                candidate.frombytes(blob)
+                score = _cosine(embedding, candidate)
+                if score > best_score:
+                    best_score, best = score, components
+            
+            if best is not None and best_score >= self.similarity_threshold:
+                return orjson.loads(best), embedding
+            
+            return None, embedding
+    
+    def _set_sync(self, topic: str, components: Dict[str, Any], embedding: Optional[array] = None):
+        """Store components for a topic (blocking)."""
+        if embedding is None:
+            embedding = self._embed(topic)
+        
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, topic, components, embedding, created_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    topic_key(topic),
+                    normalize_topic(topic),
+                    orjson.dumps(components, default=str),
+                    embedding.tobytes() if embedding is not None else None,
+                    time.time()
+                )
+            )
+    
+    async def get(self, topic: str) -> Tuple[Optional[Dict[str, Any]], Optional[array]]:
+        """Return cached blog components for a topic (None on a miss) and the topic embedding computed for the lookup.
+        
+        Pass the embedding on to set() after a miss so the topic is not embedded twice.
+        """
+        try:
+            components, embedding = await asyncio.to_thread(self._get_sync, topic)
+        except Exception as e:
+            logger.error("Error reading response cache: %s", e)
+            components, embedding = None, None
+        
+        if components is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return components, embedding
+    
+    async def set(self, topic: str, components: Dict[str, Any], embedding: Optional[array] = None):
+        """Cache generated blog components for a topic.
+        
+        Args:
+            topic: Topic the components were generated for
+            components: Blog components to store
+            embedding: Topic embedding returned by get() (computed here if omitted)
+        """
+        try:
+            await asyncio.to_thread(self._set_sync, topic, components, embedding)
+        except Exception as e:
+            logger.error("Error writing response cache: %s", e)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total * 100) if total > 0 else 0
+        }
+
+# Global response cache instance
+response_cache = ResponseCache()
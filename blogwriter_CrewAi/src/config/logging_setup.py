@@ -0,0 +1,55 @@
+"""Logging configuration that keeps log I/O off the event loop."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional, TextIO
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_listener():
+    """Flush and stop the background log listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def setup_logging(level=logging.INFO, fmt: str = DEFAULT_FORMAT, stream: Optional[TextIO] = None) -> logging.handlers.QueueListener:
+    """Route root logging through a queue drained by a background thread.
+
+    Args:
+        level: Root logging level
+        fmt: Format string for emitted records
+        stream: Output stream (defaults to stderr)
+    """
+    global _listener
+
+    # Replace any listener from a previous call
+    _stop_listener()
+
+    log_queue = queue.Queue(-1)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(fmt))
+
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    # The queue handler only merges the message; the listener applies fmt
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    logging.basicConfig(
+        handlers=[queue_handler],
+        level=level,
+        force=True
+    )
+
+    return _listener
+
+# Drain pending records before the interpreter exits
+atexit.register(_stop_listener)
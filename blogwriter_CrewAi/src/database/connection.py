@@ -1,82 +1,299 @@
 """Database connection and operations module using Prisma."""
 
 import asyncio
+import json
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import os
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Union, AsyncIterator, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
 
+from dotenv import load_dotenv
 from prisma import Prisma
-from prisma.models import BlogPost, GenerationLog
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Models are only needed at runtime for raw query deserialization
+if TYPE_CHECKING:
+    from prisma.models import BlogPost, GenerationLog
+
+# Load environment variables
+load_dotenv()
+
+# Logging is configured by the application entrypoint
 logger = logging.getLogger(__name__)
 
+# Hot-path queries use constant, parameterized SQL so the query engine and
+# PostgreSQL can reuse prepared statements instead of re-parsing each call
+RECENT_POSTS_SQL = 'SELECT * FROM "blog_posts" ORDER BY "createdAt" DESC LIMIT $1'
+POST_BY_ID_SQL = 'SELECT * FROM "blog_posts" WHERE "id" = $1'
+# Listing projection without the (large) markdown content column
+RECENT_POST_SUMMARIES_SQL = (
+    'SELECT "id", "title", "topic", "tags", "wordCount", "metaDescription", "slug", '
+    '"createdAt", "updatedAt", "published" '
+    'FROM "blog_posts" ORDER BY "createdAt" DESC LIMIT $1'
+)
+# Keyset continuation of the summary listing, ordered by ("createdAt", "id")
+RECENT_POST_SUMMARIES_FIRST_SQL = (
+    'SELECT "id", "title", "topic", "tags", "wordCount", "metaDescription", "slug", '
+    '"createdAt", "updatedAt", "published" '
+    'FROM "blog_posts" ORDER BY "createdAt" DESC, "id" DESC LIMIT $1'
+)
+RECENT_POST_SUMMARIES_AFTER_SQL = (
+    'SELECT "id", "title", "topic", "tags", "wordCount", "metaDescription", "slug", '
+    '"createdAt", "updatedAt", "published" '
+    'FROM "blog_posts" WHERE ("createdAt", "id") < ($1::timestamp, $2) '
+    'ORDER BY "createdAt" DESC, "id" DESC LIMIT $3'
+)
+
+# All generation stats since a threshold in one round trip: a single range
+# scan of generation_logs (served by the ("createdAt", "status") index) plus
+# the blog post count. Timestamps are stored as naive UTC.
+GENERATION_STATS_SQL = (
+    'SELECT COUNT(*)::int AS "total", '
+    'COUNT(*) FILTER (WHERE "status" = \'success\')::int AS "successful", '
+    'COUNT(*) FILTER (WHERE "status" = \'failed\')::int AS "failed", '
+    '(SELECT COUNT(*)::int FROM "blog_posts" WHERE "createdAt" >= $1::timestamp) AS "posts" '
+    'FROM "generation_logs" WHERE "createdAt" >= $1::timestamp'
+)
+
+# Recent posts and generation stats in one round trip: the stats row with
+# the latest posts aggregated into a JSON array. Timestamps are tagged as
+# UTC so they parse to aware datetimes like regular Prisma results.
+DASHBOARD_SQL = (
+    'WITH "recent" AS ('
+    'SELECT "id", "title", "content", "topic", "tags", "metaDescription", "slug", '
+    '"createdAt" AT TIME ZONE \'UTC\' AS "createdAt", "updatedAt" AT TIME ZONE \'UTC\' AS "updatedAt", '
+    '"published", "wordCount" '
+    'FROM "blog_posts" ORDER BY "createdAt" DESC LIMIT $2'
+    ') '
+    'SELECT "stats".*, '
+    '(SELECT COALESCE(json_agg("recent" ORDER BY "recent"."createdAt" DESC), \'[]\'::json) FROM "recent") AS "recentPosts" '
+    f'FROM ({GENERATION_STATS_SQL}) AS "stats"'
+)
+
+# Generation logs are buffered and written in batches in the background
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+LOG_FLUSH_BATCH_SIZE = 100
+
+# Generated posts are not edited after creation, so lookups by ID can be
+# served from memory for a while
+POST_CACHE_TTL = 300  # seconds
+POST_CACHE_MAX_SIZE = 1024
+
+# Callers allowed to use the shared Prisma client at once
+POOL_MAX_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+# Seconds a successful checkout ping is trusted before the next checkout pings again
+POOL_RECYCLE = 1800
+
+# Slug normalization patterns
+_SLUG_NON_ALNUM = re.compile(r'[^a-z0-9\s-]')
+_SLUG_COLLAPSE = re.compile(r'[\s-]+')
+
+@lru_cache(maxsize=1024)
+def slugify(title: str) -> str:
+    """Generate a URL-friendly slug (at most 100 characters) from a title."""
+    # Lowercase, drop special characters, collapse spaces/hyphens and trim hyphens
+    return _SLUG_COLLAPSE.sub('-', _SLUG_NON_ALNUM.sub('', title.lower())).strip('-')[:100]
+
+def _datasource_url() -> Optional[str]:
+    """Return DATABASE_URL with the query engine pool size applied, if configured."""
+    url = os.getenv("DATABASE_URL")
+    limit = os.getenv("DATABASE_CONNECTION_LIMIT")
+    
+    if not url or not limit or "connection_limit=" in url:
+        return url
+    
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}connection_limit={int(limit)}"
+
+class ConnectionPool:
+    """Bounded async access to the shared Prisma client.
+    
+    Prisma's query engine already pools PostgreSQL connections (sized by
+    ``connection_limit``), so every checkout hands out the same connected
+    client; the pool connects it on demand and caps concurrent users. With
+    ``pre_ping`` a checkout first verifies the connection (at most once per
+    ``recycle`` seconds) and reconnects if it went stale.
+    """
+    
+    def __init__(
+        self,
+        manager: "DatabaseManager",
+        max_size: int = POOL_MAX_SIZE,
+        pre_ping: bool = True,
+        recycle: float = POOL_RECYCLE
+    ):
+        self._manager = manager
+        self.max_size = max_size
+        self.pre_ping = pre_ping
+        self.recycle = recycle
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Monotonic time of the last successful checkout ping
+        self._verified_at: Optional[float] = None
+    
+    @property
+    def _slots(self) -> asyncio.Semaphore:
+        """Checkout semaphore, created on first use inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_size)
+        return self._semaphore
+    
+    async def verify(self):
+        """Connect if needed and, with pre_ping, verify a connection not checked recently.
+        
+        Does not take a pool slot, so callers about to do long non-database
+        work can check the connection up front without holding one.
+        """
+        await self._manager._ensure()
+        if not self.pre_ping:
+            return
+        
+        now = time.monotonic()
+        if self._verified_at is not None and now - self._verified_at < self.recycle:
+            return
+        
+        # A failed ping marks the manager disconnected, so this reconnects
+        if not await self._manager.health_check():
+            await self._manager._ensure()
+        self._verified_at = now
+    
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Prisma]:
+        """Check out the connected client, e.g. ``async with db_manager.pool.connection() as db``."""
+        async with self._slots:
+            await self.verify()
+            yield self._manager.db
+    
+    # psycopg_pool / SQLAlchemy-style alias
+    acquire = connection
+
 class DatabaseManager:
     """Manages database connections and operations."""
     
     def __init__(self):
-        self.db = Prisma()
-        self._connected = False
+        url = _datasource_url()
+        self.db = Prisma(datasource={'url': url}) if url else Prisma()
+        # Connection state: "disconnected", "connecting" or "connected"
+        self._state = "disconnected"
+        self._lock: Optional[asyncio.Lock] = None
+        # Post ID -> (monotonic time cached, post)
+        self._post_cache: Dict[int, Tuple[float, "BlogPost"]] = {}
+        # Pending generation log rows and the task writing them out
+        self._log_buffer: deque = deque()
+        self._log_flusher: Optional[asyncio.Task] = None
+        # Shared client checkout for long-lived callers (scheduler, API)
+        self.pool = ConnectionPool(self)
+    
+    @property
+    def _state_lock(self) -> asyncio.Lock:
+        """Lock serializing connect/disconnect, created on first use inside the running loop."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+    
+    @property
+    def connected(self) -> bool:
+        """Whether the database connection is currently established."""
+        return self._state == "connected"
     
     def generate_slug(self, title: str) -> str:
         """Generate a URL-friendly slug from the title."""
-        import re
-        # Convert to lowercase and replace spaces with hyphens
-        slug = title.lower()
-        # Remove special characters and keep only alphanumeric, spaces, and hyphens
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        # Replace multiple spaces/hyphens with single hyphen
-        slug = re.sub(r'[\s-]+', '-', slug)
-        # Remove leading/trailing hyphens
-        slug = slug.strip('-')
-        # Limit length
-        return slug[:100]
+        return slugify(title)
     
     async def connect(self, retries: int = 3, retry_delay: int = 5):
         """Connect to the database with retry logic."""
-        if self._connected:
+        if self._state == "connected":
             return
-            
-        for attempt in range(retries):
-            try:
-                logger.info(f"Attempting database connection (attempt {attempt + 1}/{retries})...")
-                await self.db.connect()
-                self._connected = True
-                logger.info("Connected to database successfully")
+        
+        async with self._state_lock:
+            # Another task may have connected while we waited for the lock
+            if self._state == "connected":
                 return
-            except Exception as e:
-                logger.error(f"Database connection attempt {attempt + 1} failed: {e}")
-                if attempt == retries - 1:
-                    logger.error("All database connection attempts failed")
-                    raise
-                else:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    await asyncio.sleep(retry_delay)
+            
+            self._state = "connecting"
+            
+            # Drop a stale engine left behind by a failed health check
+            if self.db.is_connected():
+                await self.db.disconnect()
+            
+            for attempt in range(retries):
+                try:
+                    logger.info("Attempting database connection (attempt %s/%s)...", attempt + 1, retries)
+                    await self.db.connect()
+                    self._state = "connected"
+                    logger.info("Connected to database successfully")
+                    return
+                except Exception as e:
+                    logger.error("Database connection attempt %s failed: %s", attempt + 1, e)
+                    if attempt == retries - 1:
+                        logger.error("All database connection attempts failed")
+                        self._state = "disconnected"
+                        raise
+                    else:
+                        logger.info("Retrying in %s seconds...", retry_delay)
+                        await asyncio.sleep(retry_delay)
     
-    async def disconnect(self):
-        """Disconnect from the database."""
-        if self._connected:
+    async def _ensure(self):
+        """Connect if needed; concurrent callers share a single connect under the state lock."""
+        if self._state != "connected":
+            await self.connect()
+    
+    async def startup(self, app: Any = None):
+        """Open the connection pool before serving (FastAPI lifespan / CLI entrypoint hook)."""
+        await self.connect()
+    
+    async def shutdown(self, app: Any = None):
+        """Close the connection pool on exit (FastAPI lifespan / CLI entrypoint hook)."""
+        await self.ensure_disconnected()
+    
+    async def ensure_disconnected(self) -> bool:
+        """Disconnect from the database if connected; safe to call repeatedly.
+        
+        Returns:
+            True if this call closed an open connection
+        """
+        # Write out buffered generation logs while the connection is still open
+        if self._state == "connected":
+            await self.flush_generation_logs()
+        
+        async with self._state_lock:
+            if self._state != "connected":
+                return False
+            
             try:
                 await self.db.disconnect()
-                self._connected = False
                 logger.info("Disconnected from database")
             except Exception as e:
-                logger.error(f"Error disconnecting from database: {e}")
+                logger.error("Error disconnecting from database: %s", e)
+            finally:
+                self._state = "disconnected"
+            
+            return True
+    
+    async def disconnect(self):
+        """Disconnect from the database."""
+        await self.ensure_disconnected()
     
     async def health_check(self):
         """Check if database connection is healthy."""
         try:
-            if not self._connected:
+            if not self.connected:
                 return False
             # Try a simple query to test connection
             await self.db.query_raw("SELECT 1")
             return True
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            self._connected = False
+            logger.error("Database health check failed: %s", e)
+            self._state = "disconnected"
             return False
     
+    def transaction(self):
+        """Return an interactive transaction for use as ``async with db_manager.transaction() as tx``."""
+        return self.db.tx()
+    
     async def create_blog_post(
         self,
         title: str,
@@ -86,11 +303,10 @@ class DatabaseManager:
         word_count: Optional[int] = None,
         meta_description: Optional[str] = None,
         slug: Optional[str] = None
-    ) -> Optional[BlogPost]:
+    ) -> Optional["BlogPost"]:
         """Create a new blog post in the database."""
         try:
-            if not self._connected:
-                await self.connect()
+            await self._ensure()
             
             # Generate slug if not provided
             if not slug:
@@ -109,35 +325,166 @@ class DatabaseManager:
                 }
             )
             
-            logger.info(f"Created blog post: {blog_post.title} (ID: {blog_post.id})")
+            logger.info("Created blog post: %s (ID: %s)", blog_post.title, blog_post.id)
             return blog_post
             
         except Exception as e:
-            logger.error(f"Error creating blog post: {e}")
+            logger.error("Error creating blog post: %s", e)
             return None
     
-    async def get_recent_blog_posts(self, limit: int = 10) -> List[BlogPost]:
-        """Get recent blog posts."""
+    async def create_blog_post_with_log(
+        self,
+        title: str,
+        content: str,
+        topic: str,
+        tags: List[str] = None,
+        word_count: Optional[int] = None,
+        meta_description: Optional[str] = None,
+        slug: Optional[str] = None
+    ) -> Optional["BlogPost"]:
+        """Create a blog post and its success log in a single transaction."""
         try:
-            if not self._connected:
-                await self.connect()
+            await self._ensure()
             
-            posts = await self.db.blogpost.find_many(
-                order={'createdAt': 'desc'},
-                take=limit
+            async with self.transaction() as tx:
+                blog_post = await tx.blogpost.create(
+                    data={
+                        'title': title,
+                        'content': content,
+                        'topic': topic,
+                        'tags': tags or [],
+                        'wordCount': word_count,
+                        'metaDescription': meta_description,
+                        'slug': slug or self.generate_slug(title),
+                        'published': True
+                    }
+                )
+                await tx.generationlog.create(
+                    data={
+                        'topic': topic,
+                        'status': 'success',
+                        'blogPostId': blog_post.id
+                    }
+                )
+            
+            logger.info("Created blog post: %s (ID: %s)", blog_post.title, blog_post.id)
+            return blog_post
+            
+        except Exception as e:
+            logger.error("Error creating blog post: %s", e)
+            return None
+    
+    async def create_blog_posts_many(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert several blog posts in one statement.
+        
+        Args:
+            rows: Blog post data dicts using the model's field names
+        
+        Returns:
+            Number of posts created
+        """
+        if not rows:
+            return 0
+        
+        try:
+            await self._ensure()
+            
+            count = await self.db.blogpost.create_many(
+                data=[
+                    {'slug': row.get('slug') or self.generate_slug(row['title']), 'published': True, **row}
+                    for row in rows
+                ]
             )
             
+            logger.info("Created %s blog posts", count)
+            return count
+            
+        except Exception as e:
+            logger.error("Error creating blog posts: %s", e)
+            return 0
+    
+    async def get_recent_blog_posts(self, limit: int = 10, summary: bool = False) -> Union[List["BlogPost"], List[Dict[str, Any]]]:
+        """Get recent blog posts.
+        
+        Args:
+            limit: Maximum number of posts to return
+            summary: Return plain dicts without the content column instead of full models
+        """
+        try:
+            await self._ensure()
+            
+            if summary:
+                return await self.db.query_raw(RECENT_POST_SUMMARIES_SQL, limit)
+            
+            from prisma.models import BlogPost
+            posts = await self.db.query_raw(RECENT_POSTS_SQL, limit, model=BlogPost)
+            
             return posts
             
         except Exception as e:
-            logger.error(f"Error fetching recent blog posts: {e}")
+            logger.error("Error fetching recent blog posts: %s", e)
             return []
     
-    async def get_blog_posts_by_topic(self, topic: str, limit: int = 5) -> List[BlogPost]:
+    async def stream_recent_blog_posts(self, limit: int = 10, batch_size: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """Yield recent blog post summaries (without content) in fixed-size batches.
+        
+        Args:
+            limit: Maximum number of posts to yield
+            batch_size: Number of rows fetched per query
+        """
+        await self._ensure()
+        
+        remaining = limit
+        last = None
+        
+        while remaining > 0:
+            take = min(batch_size, remaining)
+            
+            if last is None:
+                rows = await self.db.query_raw(RECENT_POST_SUMMARIES_FIRST_SQL, take)
+            else:
+                rows = await self.db.query_raw(RECENT_POST_SUMMARIES_AFTER_SQL, last["createdAt"], last["id"], take)
+            
+            for row in rows:
+                yield row
+            
+            if len(rows) < take:
+                return
+            
+            remaining -= len(rows)
+            last = rows[-1]
+    
+    async def get_blog_post(self, post_id: int) -> Optional["BlogPost"]:
+        """Get a single blog post by ID, served from the post cache when fresh."""
+        now = time.monotonic()
+        cached = self._post_cache.get(post_id)
+        if cached and now - cached[0] < POST_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            await self._ensure()
+            
+            from prisma.models import BlogPost
+            post = await self.db.query_first(POST_BY_ID_SQL, post_id, model=BlogPost)
+            
+            if post:
+                # Drop a stale entry first so re-caching it never evicts another post
+                self._post_cache.pop(post_id, None)
+                if len(self._post_cache) >= POST_CACHE_MAX_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._post_cache.pop(next(iter(self._post_cache)))
+                self._post_cache[post_id] = (now, post)
+            
+            return post
+            
+        except Exception as e:
+            logger.error("Error fetching blog post %s: %s", post_id, e)
+            return None
+    
+    async def get_blog_posts_by_topic(self, topic: str, limit: int = 5) -> List["BlogPost"]:
         """Get blog posts by topic."""
         try:
-            if not self._connected:
-                await self.connect()
+            await self._ensure()
             
             posts = await self.db.blogpost.find_many(
                 where={'topic': {'contains': topic, 'mode': 'insensitive'}},
@@ -148,7 +495,7 @@ class DatabaseManager:
             return posts
             
         except Exception as e:
-            logger.error(f"Error fetching blog posts by topic: {e}")
+            logger.error("Error fetching blog posts by topic: %s", e)
             return []
     
     async def log_generation_attempt(
@@ -157,11 +504,10 @@ class DatabaseManager:
         status: str,
         error_msg: Optional[str] = None,
         blog_post_id: Optional[int] = None
-    ) -> Optional[GenerationLog]:
+    ) -> Optional["GenerationLog"]:
         """Log a blog generation attempt."""
         try:
-            if not self._connected:
-                await self.connect()
+            await self._ensure()
             
             log_entry = await self.db.generationlog.create(
                 data={
@@ -172,70 +518,128 @@ class DatabaseManager:
                 }
             )
             
-            logger.info(f"Logged generation attempt: {topic} - {status}")
+            logger.info("Logged generation attempt: %s - %s", topic, status)
             return log_entry
             
         except Exception as e:
-            logger.error(f"Error logging generation attempt: {e}")
+            logger.error("Error logging generation attempt: %s", e)
             return None
     
+    async def log_generations_many(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert several generation log entries in one statement.
+        
+        Args:
+            rows: Log data dicts using the model's field names
+        
+        Returns:
+            Number of log entries created
+        """
+        if not rows:
+            return 0
+        
+        try:
+            await self._ensure()
+            
+            count = await self.db.generationlog.create_many(data=rows)
+            
+            logger.info("Logged %s generation attempts", count)
+            return count
+            
+        except Exception as e:
+            logger.error("Error logging generation attempts: %s", e)
+            return 0
+    
+    def enqueue_generation_log(
+        self,
+        topic: str,
+        status: str,
+        error_msg: Optional[str] = None,
+        blog_post_id: Optional[int] = None
+    ):
+        """Buffer a generation log entry; a background task writes buffered entries in batches."""
+        self._log_buffer.append({
+            'topic': topic,
+            'status': status,
+            'errorMsg': error_msg,
+            'blogPostId': blog_post_id
+        })
+        
+        if self._log_flusher is None or self._log_flusher.done():
+            self._log_flusher = asyncio.create_task(self._run_log_flusher())
+    
+    async def _run_log_flusher(self):
+        """Write buffered generation logs every LOG_FLUSH_INTERVAL until the buffer is empty."""
+        while self._log_buffer:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            await self.flush_generation_logs()
+    
+    async def flush_generation_logs(self):
+        """Write all buffered generation log entries now."""
+        while self._log_buffer:
+            batch = [self._log_buffer.popleft() for _ in range(min(LOG_FLUSH_BATCH_SIZE, len(self._log_buffer)))]
+            await self.log_generations_many(batch)
+    
     async def get_generation_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get generation statistics for the last N hours."""
         try:
-            if not self._connected:
-                await self.connect()
+            await self._ensure()
             
-            # Calculate the datetime threshold
-            from datetime import datetime, timedelta
-            threshold = datetime.now() - timedelta(hours=hours)
+            # Calculate the datetime threshold (Prisma stores timestamps in UTC)
+            threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
             
-            # Get total attempts
-            total_attempts = await self.db.generationlog.count(
-                where={'createdAt': {'gte': threshold}}
-            )
+            row = await self.db.query_first(GENERATION_STATS_SQL, threshold.replace(tzinfo=None).isoformat())
             
-            # Get successful attempts
-            successful_attempts = await self.db.generationlog.count(
-                where={
-                    'createdAt': {'gte': threshold},
-                    'status': 'success'
-                }
-            )
+            return self._stats_from_row(row, hours)
             
-            # Get failed attempts
-            failed_attempts = await self.db.generationlog.count(
-                where={
-                    'createdAt': {'gte': threshold},
-                    'status': 'failed'
-                }
-            )
+        except Exception as e:
+            logger.error("Error getting generation stats: %s", e)
+            return {}
+    
+    @staticmethod
+    def _stats_from_row(row: Dict[str, Any], hours: int) -> Dict[str, Any]:
+        """Build the generation stats dict from a GENERATION_STATS_SQL row."""
+        total_attempts = row['total']
+        successful_attempts = row['successful']
+        failed_attempts = row['failed']
+        total_posts = row['posts']
+        
+        return {
+            'total_attempts': total_attempts,
+            'successful_attempts': successful_attempts,
+            'failed_attempts': failed_attempts,
+            'total_posts': total_posts,
+            'success_rate': (successful_attempts / total_attempts * 100) if total_attempts > 0 else 0,
+            'period_hours': hours
+        }
+    
+    async def get_dashboard(self, limit: int = 10, hours: int = 24) -> Tuple[List["BlogPost"], Dict[str, Any]]:
+        """Get recent blog posts and generation statistics in a single query."""
+        from prisma.models import BlogPost
+        
+        try:
+            await self._ensure()
             
-            # Get total blog posts created
-            total_posts = await self.db.blogpost.count(
-                where={'createdAt': {'gte': threshold}}
-            )
+            threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
+            row = await self.db.query_first(DASHBOARD_SQL, threshold.replace(tzinfo=None).isoformat(), limit)
+            
+            recent = row['recentPosts']
+            if isinstance(recent, str):
+                recent = json.loads(recent)
             
-            return {
-                'total_attempts': total_attempts,
-                'successful_attempts': successful_attempts,
-                'failed_attempts': failed_attempts,
-                'total_posts': total_posts,
-                'success_rate': (successful_attempts / total_attempts * 100) if total_attempts > 0 else 0,
-                'period_hours': hours
-            }
+            return [BlogPost(**post) for post in recent], self._stats_from_row(row, hours)
             
         except Exception as e:
-            logger.error(f"Error getting generation stats: {e}")
-            return {}
+            logger.error("Error getting dashboard: %s", e)
+            return [], {}
 
 # Global database manager instance
 db_manager = DatabaseManager()
 
 # Convenience functions
-async def save_blog_post(title: str, content: str, topic: str, tags: List[str] = None, word_count: Optional[int] = None, meta_description: Optional[str] = None, slug: Optional[str] = None) -> Optional[BlogPost]:
+async def save_blog_post(title: str, content: str, topic: str, tags: List[str] = None, word_count: Optional[int] = None, meta_description: Optional[str] = None, slug: Optional[str] = None) -> Optional["BlogPost"]:
     """Convenience function to save a blog post."""
     return await db_manager.create_blog_post(title, content, topic, tags, word_count, meta_description, slug)
 
-async def log_generation(topic: str, status: str, error_msg: Optional[str] = None, blog_post_id: Optional[int] = None) -> Optional[GenerationLog]:
-    """Convenience function to log generation attempt."""
-    return await db_manager.log_generation_attempt(topic, status, error_msg, blog_post_id)
+async def log_generation(topic: str, status: str, error_msg: Optional[str] = None, blog_post_id: Optional[int] = None):
+    """Convenience function to log generation attempt (buffered, written in the background)."""
+    db_manager.enqueue_generation_log(topic, status, error_msg, blog_post_id)
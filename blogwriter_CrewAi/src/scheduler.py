@@ -1,135 +1,264 @@
-"""Blog generation scheduler using APScheduler."""
+"""Blog generation scheduler driven by a single event loop timer."""
 
 import asyncio
+import heapq
+import itertools
 import logging
-from datetime import datetime
-from typing import Optional
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.executors.asyncio import AsyncIOExecutor
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple, Dict, Any, List, Set, Callable, Awaitable, NamedTuple
 
 from .blog_generator import blog_generator
 from .database.connection import db_manager
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint
 logger = logging.getLogger(__name__)
 
+# Job tasks start eagerly on Python 3.12+, so fast paths complete without
+# an extra trip through the event loop
+_EAGER_START = sys.version_info >= (3, 12)
+
+# call_at may wake marginally before the requested time
+_FIRE_TOLERANCE = 0.001  # seconds
+
+# Manual generations allowed to run alongside each other and scheduled runs
+MANUAL_TRIGGER_CONCURRENCY = 4
+
+# 24-hour stats are reused until the next hourly stats tick
+STATS_CACHE_TTL = 3600  # seconds
+
+class ScheduledJob(NamedTuple):
+    """A recurring scheduler job."""
+    id: str
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: float  # seconds between runs
+    trigger: str
+    coalesce: bool = True  # Collapse missed runs into one
+    max_instances: int = 1  # Prevent overlapping jobs
+    misfire_grace_time: Optional[float] = None  # Seconds a late run may still start (None: no limit)
+    ready: Optional[Callable[[], bool]] = None  # Checked before each run; False skips it
+
+def _seconds_until_utc(hour: int, minute: int = 0) -> float:
+    """Seconds from now until the next occurrence of hour:minute UTC."""
+    now = datetime.now(timezone.utc)
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
 class BlogScheduler:
     """Manages scheduled blog generation tasks."""
     
     def __init__(self):
-        # Configure scheduler with asyncio executor
-        executors = {
-            'default': AsyncIOExecutor(),
-        }
+        # (loop time of next run, sequence tiebreaker, job), armed by one call_at timer
+        self._queue: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Job ID -> tasks still running for that job
+        self._job_tasks: Dict[str, Set[asyncio.Task]] = {}
         
-        job_defaults = {
-            'coalesce': False,
-            'max_instances': 1,  # Prevent overlapping jobs
-            'misfire_grace_time': 300  # 5 minutes grace time
-        }
+        self._running = False
+        self._manual_semaphore: Optional[asyncio.Semaphore] = None
+        # Scheduled and manual generations currently running
+        self._generations_in_flight = 0
+        # (monotonic time fetched, stats) for the last 24 hours
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+    
+    async def _get_daily_stats(self) -> Dict[str, Any]:
+        """Return 24-hour generation stats, reusing a result fetched within the TTL."""
+        now = time.monotonic()
+        if self._stats_cache and now - self._stats_cache[0] < STATS_CACHE_TTL:
+            return self._stats_cache[1]
         
-        self.scheduler = AsyncIOScheduler(
-            executors=executors,
-            job_defaults=job_defaults,
-            timezone='UTC'
-        )
+        async with db_manager.pool.acquire():
+            stats = await db_manager.get_generation_stats(hours=24)
         
-        self._running = False
+        if stats:
+            self._stats_cache = (now, stats)
+        return stats
+    
+    def _generation_idle(self) -> bool:
+        """Whether no blog generation (scheduled or manual) is running."""
+        return self._generations_in_flight == 0
     
     async def generate_blog_job(self):
         """Job function to generate a blog post."""
+        self._generations_in_flight += 1
         try:
             logger.info("Starting scheduled blog generation...")
             
-            # Ensure database connection
-            await db_manager.connect()
+            # Verify the connection up front without holding a pool slot through
+            # the long LLM run (the generator's own DB calls check out as needed)
+            await db_manager.pool.verify()
             
-            # Generate blog post
             result = await blog_generator.generate_blog_post()
             
             if result:
-                logger.info(f"Successfully generated blog post: {result['title']}")
-                logger.info(f"Blog ID: {result['id']}, Word count: {result['word_count']}")
+                # New post invalidates the cached stats
+                self._stats_cache = None
+                logger.info("Successfully generated blog post: %s", result['title'])
+                logger.info("Blog ID: %s, Word count: %s", result['id'], result['word_count'])
             else:
                 logger.warning("Blog generation returned no result")
                 
         except Exception as e:
-            logger.error(f"Error in scheduled blog generation: {e}")
+            logger.error("Error in scheduled blog generation: %s", e)
+        finally:
+            self._generations_in_flight -= 1
     
     async def generate_stats_job(self):
         """Job function to log generation statistics."""
         try:
-            await db_manager.connect()
-            stats = await db_manager.get_generation_stats(hours=24)
+            stats = await self._get_daily_stats()
             
             if stats:
                 logger.info("=== Blog Generation Stats (Last 24 Hours) ===")
-                logger.info(f"Total attempts: {stats.get('total_attempts', 0)}")
-                logger.info(f"Successful: {stats.get('successful_attempts', 0)}")
-                logger.info(f"Failed: {stats.get('failed_attempts', 0)}")
-                logger.info(f"Success rate: {stats.get('success_rate', 0):.1f}%")
-                logger.info(f"Total posts created: {stats.get('total_posts', 0)}")
+                logger.info("Total attempts: %s", stats.get('total_attempts', 0))
+                logger.info("Successful: %s", stats.get('successful_attempts', 0))
+                logger.info("Failed: %s", stats.get('failed_attempts', 0))
+                logger.info("Success rate: %.1f%%", stats.get('success_rate', 0))
+                logger.info("Total posts created: %s", stats.get('total_posts', 0))
                 
         except Exception as e:
-            logger.error(f"Error getting generation stats: {e}")
+            logger.error("Error getting generation stats: %s", e)
     
-    def start_scheduler(self, interval_minutes: int = 1440):  # Default to 1 day
-        """Start the blog generation scheduler."""
+    def start_scheduler(
+        self,
+        interval_minutes: int = 1440,  # Default to 1 day
+        coalesce: bool = True,
+        max_instances: int = 1,
+        misfire_grace_time: int = 60
+    ):
+        """Start the blog generation scheduler.
+        
+        Args:
+            interval_minutes: Minutes between blog generation runs
+            coalesce: Collapse a backlog of missed generation runs into one
+            max_instances: Maximum concurrently running generation jobs
+            misfire_grace_time: Seconds a late generation run may still start
+        """
         try:
             if self._running:
                 logger.warning("Scheduler is already running")
                 return
             
+            self._loop = asyncio.get_running_loop()
+            
             # Add the main blog generation job (every N minutes)
-            self.scheduler.add_job(
-                self.generate_blog_job,
-                trigger=IntervalTrigger(minutes=interval_minutes),
-                id='blog_generation_job',
-                name='Generate Blog Post',
-                replace_existing=True
+            interval = interval_minutes * 60
+            self._add_job(
+                ScheduledJob(
+                    id='blog_generation_job',
+                    name='Generate Blog Post',
+                    func=self.generate_blog_job,
+                    interval=interval,
+                    trigger=f"interval[{timedelta(seconds=interval)}]",
+                    coalesce=coalesce,
+                    max_instances=max_instances,
+                    misfire_grace_time=misfire_grace_time,
+                    ready=self._generation_idle
+                ),
+                delay=interval
             )
             
             # Add a stats reporting job (every hour)
-            self.scheduler.add_job(
-                self.generate_stats_job,
-                trigger=IntervalTrigger(hours=1),
-                id='stats_reporting_job',
-                name='Report Generation Stats',
-                replace_existing=True
+            self._add_job(
+                ScheduledJob(
+                    id='stats_reporting_job',
+                    name='Report Generation Stats',
+                    func=self.generate_stats_job,
+                    interval=3600,
+                    trigger="interval[1:00:00]"
+                ),
+                delay=3600
             )
             
             # Add a daily cleanup job (at 2 AM UTC)
-            self.scheduler.add_job(
-                self.cleanup_job,
-                trigger=CronTrigger(hour=2, minute=0),
-                id='daily_cleanup_job',
-                name='Daily Cleanup',
-                replace_existing=True
+            self._add_job(
+                ScheduledJob(
+                    id='daily_cleanup_job',
+                    name='Daily Cleanup',
+                    func=self.cleanup_job,
+                    interval=86400,
+                    trigger="cron[hour='2', minute='0']"
+                ),
+                delay=_seconds_until_utc(2)
             )
             
             # Start the scheduler
-            self.scheduler.start()
+            self._arm()
             self._running = True
             
-            logger.info(f"Blog scheduler started successfully!")
+            logger.info("Blog scheduler started successfully!")
             if interval_minutes >= 1440:
                 hours = interval_minutes // 60
-                logger.info(f"Blog generation interval: {hours} hours ({interval_minutes} minutes)")
+                logger.info("Blog generation interval: %s hours (%s minutes)", hours, interval_minutes)
             else:
-                logger.info(f"Blog generation interval: {interval_minutes} minutes")
+                logger.info("Blog generation interval: %s minutes", interval_minutes)
             logger.info("Next job times:")
             
-            for job in self.scheduler.get_jobs():
-                logger.info(f"  - {job.name}: {job.next_run_time}")
+            for job in self.get_job_info():
+                logger.info("  - %s: %s", job['name'], job['next_run_time'])
                 
         except Exception as e:
-            logger.error(f"Error starting scheduler: {e}")
+            logger.error("Error starting scheduler: %s", e)
             raise
     
+    def _add_job(self, job: ScheduledJob, delay: float):
+        """Queue a job to first run after delay seconds."""
+        heapq.heappush(self._queue, (self._loop.time() + delay, next(self._sequence), job))
+    
+    def _arm(self):
+        """Point the single timer at the earliest queued run."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._queue:
+            self._timer = self._loop.call_at(self._queue[0][0], self._fire)
+    
+    def _fire(self):
+        """Start every due job, requeue it for its next run and re-arm the timer."""
+        self._timer = None
+        now = self._loop.time()
+        
+        while self._queue and self._queue[0][0] <= now + _FIRE_TOLERANCE:
+            when, _, job = heapq.heappop(self._queue)
+            self._run_job(job, late=now - when)
+            
+            next_when = when + job.interval
+            if job.coalesce and next_when <= now:
+                # Collapse missed runs into the next future one
+                next_when += ((now - next_when) // job.interval + 1) * job.interval
+            heapq.heappush(self._queue, (next_when, next(self._sequence), job))
+        
+        self._arm()
+    
+    def _run_job(self, job: ScheduledJob, late: float):
+        """Start one run of a job unless it missed its window, is already running or is not ready."""
+        if job.misfire_grace_time is not None and late > job.misfire_grace_time:
+            logger.warning("Run of job %s was missed by %.0f seconds, skipping", job.name, late)
+            return
+        
+        if job.ready is not None and not job.ready():
+            logger.info("Job %s is not ready (work already in flight), skipping this run", job.name)
+            return
+        
+        running = self._job_tasks.setdefault(job.id, set())
+        if len(running) >= job.max_instances:
+            logger.warning("Job %s is still running (max_instances=%s), skipping this run", job.name, job.max_instances)
+            return
+        
+        if _EAGER_START:
+            # Eager only for this task; the loop's task factory is left alone
+            task = asyncio.Task(job.func(), loop=self._loop, eager_start=True)
+        else:
+            task = self._loop.create_task(job.func())
+        running.add(task)
+        task.add_done_callback(running.discard)
+    
     def stop_scheduler(self):
         """Stop the blog generation scheduler."""
         try:
@@ -137,25 +266,27 @@ class BlogScheduler:
                 logger.warning("Scheduler is not running")
                 return
             
-            self.scheduler.shutdown(wait=True)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._queue.clear()
             self._running = False
             logger.info("Blog scheduler stopped successfully")
             
         except Exception as e:
-            logger.error(f"Error stopping scheduler: {e}")
+            logger.error("Error stopping scheduler: %s", e)
     
     async def cleanup_job(self):
         """Daily cleanup job to maintain database health."""
         try:
             logger.info("Running daily cleanup job...")
-            await db_manager.connect()
             
             # Get cleanup stats
-            stats = await db_manager.get_generation_stats(hours=24)
-            logger.info(f"Cleaned up data. Stats: {stats}")
+            stats = await self._get_daily_stats()
+            logger.info("Cleaned up data. Stats: %s", stats)
             
         except Exception as e:
-            logger.error(f"Error in cleanup job: {e}")
+            logger.error("Error in cleanup job: %s", e)
     
     def is_running(self) -> bool:
         """Check if the scheduler is running."""
@@ -166,21 +297,37 @@ class BlogScheduler:
         if not self._running:
             return []
         
+        # Convert loop-clock run times to wall-clock UTC
+        now = datetime.now(timezone.utc)
+        loop_now = self._loop.time()
+        
         jobs_info = []
-        for job in self.scheduler.get_jobs():
+        for when, _, job in sorted(self._queue):
             jobs_info.append({
                 'id': job.id,
                 'name': job.name,
-                'next_run_time': job.next_run_time,
-                'trigger': str(job.trigger)
+                'next_run_time': now + timedelta(seconds=when - loop_now),
+                'trigger': job.trigger
             })
         
         return jobs_info
     
+    @property
+    def _manual_slots(self) -> asyncio.Semaphore:
+        """Bound on concurrent manual generations, created on first use inside the running loop."""
+        if self._manual_semaphore is None:
+            self._manual_semaphore = asyncio.Semaphore(MANUAL_TRIGGER_CONCURRENCY)
+        return self._manual_semaphore
+    
     async def generate_now(self):
-        """Trigger blog generation immediately (for testing/manual trigger)."""
+        """Trigger blog generation immediately (for testing/manual trigger).
+        
+        Manual runs bypass the scheduled job's max_instances limit and run
+        concurrently, up to MANUAL_TRIGGER_CONCURRENCY at a time.
+        """
         logger.info("Manually triggering blog generation...")
-        await self.generate_blog_job()
+        async with self._manual_slots:
+            await self.generate_blog_job()
 
 # Global scheduler instance
 blog_scheduler = BlogScheduler()
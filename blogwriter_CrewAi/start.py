@@ -7,8 +7,34 @@ This script helps you get started quickly with the right configuration.
 import os
 import sys
 import asyncio
+import hashlib
+import shutil
 import subprocess
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
+from typing import Optional
+
+# Marker that lets repeat runs skip prisma client generation
+PRISMA_GENERATE_CACHE = Path('.prisma_generate_cache')
+SCHEMA_PATH = Path('prisma/schema.prisma')
+
+def _prisma_cli_stamp() -> Optional[str]:
+    """Return the installed prisma entry point's mtime, or None if it is not on PATH."""
+    path = shutil.which('prisma')
+    return str(os.path.getmtime(path)) if path else None
+
+def _read_marker(path: Path) -> Optional[str]:
+    """Return a cache marker's contents, or None if it does not exist."""
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+def _schema_stamp() -> str:
+    """Hash the Prisma schema together with the CLI stamp; either changing requires regeneration."""
+    digest = hashlib.sha256(SCHEMA_PATH.read_bytes())
+    digest.update((_prisma_cli_stamp() or '').encode())
+    return digest.hexdigest()
 
 def check_requirements():
     """Check if all requirements are met."""
@@ -26,11 +52,11 @@ def check_requirements():
             print("   You can run: cp env.example .env")
         return False
     
-    # Check if prisma is installed
+    # Check if prisma is installed (package metadata lookup, no subprocess)
     try:
-        subprocess.run(['prisma', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("⚠️  Prisma CLI not found. Installing...")
+        version('prisma')
+    except PackageNotFoundError:
+        print("⚠️  Prisma not found. Installing...")
         try:
             subprocess.run([sys.executable, '-m', 'pip', 'install', 'prisma'], check=True)
             print("✅ Prisma installed successfully")
@@ -38,26 +64,50 @@ def check_requirements():
             print("❌ Failed to install Prisma")
             return False
     
+    if shutil.which('prisma') is None:
+        print("❌ Prisma CLI not found on PATH")
+        return False
+    
     print("✅ All requirements met!")
     return True
 
-def setup_database():
+async def run_prisma(*args: str):
+    """Run a prisma CLI command, raising CalledProcessError if it fails."""
+    process = await asyncio.create_subprocess_exec('prisma', *args)
+    returncode = await process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, ['prisma', *args])
+
+async def setup_database():
     """Setup database schema."""
     print("🗄️  Setting up database...")
     
     try:
-        # Generate Prisma client
-        print("   Generating Prisma client...")
-        subprocess.run(['prisma', 'generate'], check=True)
-        
-        # Push schema to database
+        # Push schema to database; codegen runs separately so the two can overlap
         print("   Pushing schema to database...")
-        subprocess.run(['prisma', 'db', 'push'], check=True)
+        commands = [run_prisma('db', 'push', '--skip-generate')]
+        
+        # Generate Prisma client (skipped while the schema and CLI are unchanged)
+        schema_stamp = _schema_stamp()
+        if _read_marker(PRISMA_GENERATE_CACHE) == schema_stamp:
+            print("   Prisma client is up to date")
+        else:
+            print("   Generating Prisma client...")
+            commands.append(run_prisma('generate'))
+        
+        # Let both commands finish before reporting the first failure
+        results = await asyncio.gather(*commands, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        
+        if len(commands) > 1:
+            PRISMA_GENERATE_CACHE.write_text(schema_stamp)
         
         print("✅ Database setup completed!")
         return True
         
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
         print(f"❌ Database setup failed: {e}")
         print("   Please check your DATABASE_URL in .env file")
         return False
@@ -73,7 +123,7 @@ def main():
         sys.exit(1)
     
     # Setup database
-    if not setup_database():
+    if not asyncio.run(setup_database()):
         print("\n❌ Database setup failed. Please check your configuration.")
         sys.exit(1)
     
@@ -5,13 +5,19 @@ This will generate a blog post and save it in proper markdown format.
 """
 
 import asyncio
+import itertools
 import logging
-from datetime import datetime
+import time
+
+import aiofiles
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-process sequence keeping saved filenames unique within the same second
+_POST_COUNTER = itertools.count()
+
 async def test_improved_blog_generation():
     """Test the improved blog generation with markdown formatting."""
     try:
@@ -46,7 +52,7 @@ async def test_improved_blog_generation():
             print(f"   📅 Created: {result['created_at']}")
             
             # Get the full blog post from database to show markdown
-            blog_post = await db_manager.db.blogpost.find_unique(where={"id": result['id']})
+            blog_post = await db_manager.get_blog_post(result['id'])
             
             if blog_post:
                 print(f"\n📄 Blog Post Content (Markdown Format):")
@@ -61,18 +67,20 @@ async def test_improved_blog_generation():
                     print(f"🔗 Slug: {blog_post.slug}")
                 
                 # Save to a markdown file for your website
-                filename = f"blog_post_{blog_post.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(blog_post.content)
+                filename = f"blog_post_{blog_post.id}_{next(_POST_COUNTER)}_{int(time.time())}.md"
+                async with aiofiles.open(filename, 'w', encoding='utf-8') as f:
+                    await f.write(blog_post.content)
                 
                 print(f"\n💾 Blog post saved to: {filename}")
                 print("   This file is ready to use on your website!")
         else:
             print("❌ Blog generation failed")
         
+        # Fetch recent posts and generation stats in one query
+        recent_posts, stats = await db_manager.get_dashboard(limit=3, hours=24)
+        
         # Show recent posts
         print(f"\n📚 Recent blog posts in database:")
-        recent_posts = await db_manager.get_recent_blog_posts(limit=3)
         
         for i, post in enumerate(recent_posts, 1):
             print(f"   {i}. {post.title}")
@@ -83,7 +91,6 @@ async def test_improved_blog_generation():
             print()
         
         # Show generation stats
-        stats = await db_manager.get_generation_stats(hours=24)
         if stats:
             print(f"📊 Generation Statistics (Last 24 Hours):")
             print(f"   Total attempts: {stats.get('total_attempts', 0)}")
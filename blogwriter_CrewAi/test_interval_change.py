@@ -1 +1,36 @@
- 
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Test script to verify the 24-hour blog generation interval.
+"""
+
+import asyncio
+
+EXPECTED_INTERVAL = 1440  # minutes (24 hours)
+
+async def test_interval_change():
+    """Test that the scheduler defaults to one blog generation every 24 hours."""
+    print("⏰ Testing Blog Generation Interval")
+    print("=" * 50)
+    
+    # Import the scheduler
+    try:
+        from src.scheduler import blog_scheduler
+        print("✅ Scheduler imported successfully")
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        print("Please install dependencies: pip install -r requirements.txt")
+        return False
+    
+    # Default interval (read straight from the function defaults)
+    default_interval = blog_scheduler.start_scheduler.__defaults__[0]
+    if default_interval == EXPECTED_INTERVAL:
+        print(f"✅ Default interval: {default_interval} minutes ({default_interval // 60} hours)")
+        return True
+    
+    print(f"❌ Default interval: {default_interval} minutes (expected {EXPECTED_INTERVAL})")
+    return False
+
+if __name__ == "__main__":
+    result = asyncio.run(test_interval_change())
+    if not result:
+        raise SystemExit(1)
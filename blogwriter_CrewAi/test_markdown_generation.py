@@ -5,14 +5,38 @@ This demonstrates the improved blog generation with proper markdown formatting.
 """
 
 import asyncio
+import itertools
 import logging
+import re
+import time
 from datetime import datetime
 import os
 
+import aiofiles
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-process sequence keeping saved filenames unique within the same second
+_POST_COUNTER = itertools.count()
+
+# Slug normalization patterns
+_SLUG_NON_ALNUM = re.compile(r'[^a-z0-9\s-]')
+_SLUG_COLLAPSE = re.compile(r'[\s-]+')
+
+# Website front matter, filled per post with format_map
+_FRONT_MATTER_TMPL = (
+    '---\n'
+    'title: "{title}"\n'
+    'date: {date}\n'
+    'tags: [{tags}]\n'
+    'description: "{description}"\n'
+    'slug: "{slug}"\n'
+    '---\n'
+    '\n'
+)
+
 async def test_markdown_generation():
     """Test markdown generation without database dependency."""
     try:
@@ -20,7 +44,7 @@ async def test_markdown_generation():
         print("=" * 60)
         
         # Import components
-        from src.blog_generator import EnhancedBlogGenerator
+        from src.blog_generator import EnhancedBlogGenerator, run_markdown_task
         
         print("✅ Blog generator imported successfully")
         
@@ -80,42 +104,39 @@ Meta Description: Discover how AI agents are transforming business operations in
         print("\n📝 Testing blog component extraction...")
         
         # Test the extraction functionality
-        blog_components = generator.extract_blog_components(sample_blog_output)
+        blog_components = await run_markdown_task(generator.extract_blog_components, sample_blog_output)
         
         print(f"✅ Blog components extracted successfully!")
-        print(f"   📋 Title: {blog_components['title']}")
-        print(f"   📊 Word Count: {blog_components['word_count']}")
-        print(f"   🏷️  Tags: {', '.join(blog_components['tags'])}")
-        if blog_components.get('meta_description'):
-            print(f"   🔍 Meta Description: {blog_components['meta_description']}")
+        print(f"   📋 Title: {blog_components.title}")
+        print(f"   📊 Word Count: {blog_components.word_count}")
+        print(f"   🏷️  Tags: {', '.join(blog_components.tags)}")
+        if blog_components.meta_description:
+            print(f"   🔍 Meta Description: {blog_components.meta_description}")
         
         # Test markdown formatting
         print(f"\n📄 Testing markdown formatting...")
-        formatted_content = generator.ensure_proper_markdown(blog_components['content'])
+        formatted_content = await run_markdown_task(generator.ensure_proper_markdown, blog_components.content)
         
         # Save the generated blog post to a markdown file
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"sample_blog_post_{timestamp}.md"
+        filename = f"sample_blog_post_{next(_POST_COUNTER)}_{int(time.time())}.md"
         
         # Create a complete markdown file with front matter for websites
-        front_matter = f"""---
-title: "{blog_components['title']}"
-date: {datetime.now().isoformat()}
-tags: [{', '.join([f'"{tag}"' for tag in blog_components['tags']])}]
-description: "{blog_components.get('meta_description', 'AI-generated blog post about generative AI')}"
-slug: "{generator.generate_slug(blog_components['title']) if hasattr(generator, 'generate_slug') else blog_components['title'].lower().replace(' ', '-')}"
----
-
-"""
-        
-        full_content = front_matter + formatted_content
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(full_content)
+        front_matter = _FRONT_MATTER_TMPL.format_map({
+            'title': blog_components.title,
+            'date': datetime.now().isoformat(),
+            'tags': ', '.join(f'"{tag}"' for tag in blog_components.tags),
+            'description': blog_components.meta_description or 'AI-generated blog post about generative AI',
+            'slug': generator.generate_slug(blog_components.title) if hasattr(generator, 'generate_slug') else blog_components.title.lower().replace(' ', '-')
+        })
+        
+        # Write front matter and body separately rather than concatenating a second copy
+        async with aiofiles.open(filename, 'w', encoding='utf-8') as f:
+            await f.write(front_matter)
+            await f.write(formatted_content)
         
         print(f"✅ Markdown formatting completed!")
         print(f"💾 Blog post saved to: {filename}")
-        print(f"   File size: {len(full_content)} characters")
+        print(f"   File size: {len(front_matter) + len(formatted_content)} characters")
         
         # Display a preview of the generated content
         print(f"\n📖 Content Preview (First 300 characters):")
@@ -156,13 +177,12 @@ slug: "{generator.generate_slug(blog_components['title']) if hasattr(generator,
 
 def generate_slug(title: str) -> str:
     """Generate a URL-friendly slug from the title."""
-    import re
     # Convert to lowercase and replace spaces with hyphens
     slug = title.lower()
     # Remove special characters and keep only alphanumeric, spaces, and hyphens
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
+    slug = _SLUG_NON_ALNUM.sub('', slug)
     # Replace multiple spaces/hyphens with single hyphen
-    slug = re.sub(r'[\s-]+', '-', slug)
+    slug = _SLUG_COLLAPSE.sub('-', slug)
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
     # Limit length